@@ -6,28 +6,78 @@ This module is imported by fetch.py and search.py — it is not a standalone scr
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import math
+import os
+import random
+import re
 import sys
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
 from functools import cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote, urlsplit
 
 import httpxyz as httpx
 import orjson
 from dotenv import dotenv_values
-from msal import PublicClientApplication
 
-GRAPH_BASE = "https://graph.microsoft.com/v1.0"
+if TYPE_CHECKING:
+    # Deferred: MSAL is needed only to acquire tokens, asyncio only by
+    # AsyncGraphClient; both add tens of milliseconds to every CLI start.
+    import asyncio
+
+    from msal import PublicClientApplication, SerializableTokenCache
+
+# Overridable so the scripts can be pointed at a local stand-in (msgraph_mock.py).
+GRAPH_BASE = os.environ.get(
+    "MICROSOFT_GRAPH_BASE", "https://graph.microsoft.com/v1.0"
+).rstrip("/")
 NOTES_SCOPES = ("Notes.Read.All", "Sites.Read.All")
 DRIVE_SCOPES = ("Files.Read.All", "Sites.Read.All")
 SEARCH_SCOPES = ("Sites.Read.All", "Files.Read.All")
 CACHE_ROOT = Path.home() / ".cache" / "msgraph-explore"
 DEFAULT_ENV_PATH = Path(__file__).resolve().parents[1] / ".env"
+TOKEN_CACHE_DIR = CACHE_ROOT / "auth"
+HTTP_CACHE_DIR = CACHE_ROOT / "http"
+# Cached access tokens closer than this to expiry are treated as expired.
+TOKEN_EXPIRY_MARGIN = 300
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_PER_HOST_CONCURRENCY = 16
+# Process-wide request pacing; Graph throttles per app and per tenant.
+# MICROSOFT_GRAPH_RATE_LIMIT (read on first use) or --rate-limit overrides it.
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+# Microsoft Graph accepts at most 20 sub-requests per JSON $batch call.
+GRAPH_BATCH_LIMIT = 20
+DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
 class AuthError(Exception):
     """Authentication or token acquisition failure."""
 
 
+class IntegrityError(ValueError):
+    """Downloaded bytes do not match the hashes Graph reported for the item."""
+
+    def __init__(self, url: str, name: str, actual: str, expected: str):
+        self.url = url
+        self.name = name
+        self.actual = actual
+        self.expected = expected
+        super().__init__(f"Integrity check failed for {url}: {name} {actual} != {expected}")
+
+
 class GraphApiError(Exception):
     """Microsoft Graph API returned an error response."""
 
@@ -65,12 +115,109 @@ def _update_env_refresh_token(env_path: Path, new_token: str) -> None:
             handle.write(f"MICROSOFT_REFRESH_TOKEN={new_token}\n")
 
 
+@contextmanager
+def _file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive, cross-process lock on ``lock_path``."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a+b") as handle:
+        if sys.platform == "win32":
+            import msvcrt
+
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _token_cache_path(env_path: Path, client_id: str, authority: str) -> Path:
+    key = f"{env_path.resolve()}|{client_id}|{authority}"
+    digest = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()[:16]
+    return TOKEN_CACHE_DIR / f"{digest}.json"
+
+
+def _token_fingerprint(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _redeemed_refresh_token(cache_path: Path) -> str | None:
+    """Fingerprint of the ``.env`` refresh token the cache was last built from."""
+    try:
+        return cache_path.with_suffix(".rt").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def _store_refresh_token(env_path: Path, cache_path: Path, token: str) -> None:
+    _update_env_refresh_token(env_path, token)
+    cache_path.with_suffix(".rt").write_text(_token_fingerprint(token), encoding="utf-8")
+
+
+@cache
+def _get_token_cache(cache_path: Path) -> SerializableTokenCache:
+    from msal import SerializableTokenCache
+
+    return SerializableTokenCache()
+
+
+def _load_token_cache(cache_path: Path) -> SerializableTokenCache:
+    token_cache = _get_token_cache(cache_path)
+    if cache_path.exists():
+        token_cache.deserialize(cache_path.read_text(encoding="utf-8"))
+    return token_cache
+
+
+def _save_token_cache(cache_path: Path, token_cache: SerializableTokenCache) -> None:
+    if not token_cache.has_state_changed:
+        return
+    tmp_path = cache_path.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(token_cache.serialize())
+    tmp_path.replace(cache_path)
+    token_cache.has_state_changed = False
+
+
+def _cached_access_token(
+    cache_path: Path, client_id: str, scopes: tuple[str, ...]
+) -> str | None:
+    """Read a still-valid access token straight from the serialized MSAL cache."""
+    try:
+        entries = orjson.loads(cache_path.read_bytes()).get("AccessToken", {})
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    wanted = {scope.lower() for scope in scopes}
+    deadline = time.time() + TOKEN_EXPIRY_MARGIN
+    for entry in entries.values():
+        granted = set(entry.get("target", "").lower().split())
+        if (
+            entry.get("client_id") == client_id
+            and wanted <= granted
+            and int(entry.get("expires_on", 0)) > deadline
+        ):
+            return entry["secret"]
+    return None
+
+
 @cache
 def _get_msal_app(
-    client_id: str, authority: str, scope_key: tuple[str, ...]
+    client_id: str, authority: str, cache_path: Path
 ) -> PublicClientApplication:
-    del scope_key
-    return PublicClientApplication(client_id, authority=authority)
+    from msal import PublicClientApplication
+
+    return PublicClientApplication(
+        client_id, authority=authority, token_cache=_get_token_cache(cache_path)
+    )
 
 
 def get_access_token(
@@ -78,7 +225,24 @@ def get_access_token(
     scopes: tuple[str, ...],
     *,
     allow_interactive: bool = True,
+    force_refresh: bool = False,
 ) -> str:
+    """Return a Graph access token, preferring the persistent on-disk cache.
+
+    The serialized MSAL cache lives under ``TOKEN_CACHE_DIR`` and is guarded by
+    a file lock, so concurrent processes using the same ``.env`` reuse one
+    valid access token instead of each redeeming the refresh token.
+    ``force_refresh`` skips cached access tokens (e.g. after a 401). The
+    cached-token path parses the cache file directly and never imports MSAL.
+    A ``MICROSOFT_REFRESH_TOKEN`` in ``.env`` that differs from the one last
+    redeemed or written back (e.g. pasted in for another account) is
+    redeemed before any cached token or account is used.
+    A ``MICROSOFT_ACCESS_TOKEN`` environment variable bypasses MSAL entirely,
+    which is what offline runs against ``msgraph_mock.py`` use.
+    """
+    static_token = os.environ.get("MICROSOFT_ACCESS_TOKEN")
+    if static_token:
+        return static_token
     config = dotenv_values(env_path)
     client_id = config.get("MICROSOFT_CLIENT_ID", "")
     authority = config.get("MICROSOFT_AUTHORITY", "")
@@ -87,16 +251,71 @@ def get_access_token(
             f"Missing MICROSOFT_CLIENT_ID or MICROSOFT_AUTHORITY in {env_path}"
         )
 
-    app = _get_msal_app(client_id, authority, scopes)
-    refresh_token = config.get("MICROSOFT_REFRESH_TOKEN")
+    cache_path = _token_cache_path(env_path, client_id, authority)
+    with _file_lock(cache_path.with_suffix(".lock")):
+        # Re-read under the lock: another process may have rotated it.
+        refresh_token = dotenv_values(env_path).get("MICROSOFT_REFRESH_TOKEN") or None
+        env_token_changed = bool(refresh_token) and (
+            _token_fingerprint(refresh_token) != _redeemed_refresh_token(cache_path)
+        )
+        if not force_refresh and not env_token_changed:
+            token = _cached_access_token(cache_path, client_id, scopes)
+            if token:
+                return token
+        token_cache = _load_token_cache(cache_path)
+        try:
+            return _acquire_token(
+                _get_msal_app(client_id, authority, cache_path),
+                env_path,
+                cache_path,
+                refresh_token,
+                scopes,
+                allow_interactive=allow_interactive,
+                force_refresh=force_refresh,
+                prefer_refresh_token=env_token_changed,
+            )
+        finally:
+            _save_token_cache(cache_path, token_cache)
+
+
+def _acquire_token(
+    app: PublicClientApplication,
+    env_path: Path,
+    cache_path: Path,
+    refresh_token: str | None,
+    scopes: tuple[str, ...],
+    *,
+    allow_interactive: bool,
+    force_refresh: bool,
+    prefer_refresh_token: bool = False,
+) -> str:
     refresh_error: str | None = None
-    if refresh_token:
+
+    def redeem_refresh_token() -> str | None:
+        nonlocal refresh_error
         result = app.acquire_token_by_refresh_token(refresh_token, scopes=list(scopes))
-        if "access_token" in result:
+        if "access_token" not in result:
+            refresh_error = result.get("error_description") or result.get("error", "unknown")
+            return None
+        _store_refresh_token(env_path, cache_path, result.get("refresh_token", refresh_token))
+        return result["access_token"]
+
+    if refresh_token and prefer_refresh_token:
+        if token := redeem_refresh_token():
+            return token
+
+    for account in app.get_accounts():
+        result = app.acquire_token_silent(
+            list(scopes), account=account, force_refresh=force_refresh
+        )
+        if result and "access_token" in result:
             if "refresh_token" in result:
-                _update_env_refresh_token(env_path, result["refresh_token"])
+                _store_refresh_token(env_path, cache_path, result["refresh_token"])
             return result["access_token"]
-        refresh_error = result.get("error_description") or result.get("error", "unknown")
+
+    if refresh_token and not prefer_refresh_token:
+        if token := redeem_refresh_token():
+            return token
 
     if not allow_interactive:
         detail = f" (reason: {refresh_error})" if refresh_error else ""
@@ -111,36 +330,801 @@ def get_access_token(
             f"Interactive authentication failed: {result.get('error_description')}"
         )
     if "refresh_token" in result:
-        _update_env_refresh_token(env_path, result["refresh_token"])
+        _store_refresh_token(env_path, cache_path, result["refresh_token"])
     return result["access_token"]
 
 
+def _http_client_options(
+    max_connections: int, keepalive_expiry: float, http2: bool
+) -> dict[str, Any]:
+    # HTTP/2 needs the optional ``h2`` package; fall back to HTTP/1.1 keep-alive.
+    if http2 and find_spec("h2") is None:
+        print("warning: h2 is not installed, falling back to HTTP/1.1", file=sys.stderr)
+        http2 = False
+    return {
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        "timeout": 30,
+    }
+
+
+def _build_http_client(
+    max_connections: int, keepalive_expiry: float, http2: bool
+) -> httpx.Client:
+    return httpx.Client(
+        **_http_client_options(max_connections, keepalive_expiry, http2)
+    )
+
+
+def _build_async_http_client(
+    max_connections: int, keepalive_expiry: float, http2: bool
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        **_http_client_options(max_connections, keepalive_expiry, http2)
+    )
+
+
+def _graph_url(path: str) -> str:
+    return f"{GRAPH_BASE}{path}" if path.startswith("/") else path
+
+
+def _json(response: httpx.Response) -> Any:
+    # orjson parses the raw bytes directly, skipping str decoding and stdlib json.
+    return orjson.loads(response.content)
+
+
+def _with_select(
+    params: dict[str, Any] | None, select: Sequence[str] | None
+) -> dict[str, Any] | None:
+    """Merge a ``$select`` projection into query params."""
+    if not select:
+        return params
+    return {**(params or {}), "$select": ",".join(select)}
+
+
+def _raise_for_graph_error(response: httpx.Response, url: str) -> None:
+    if not response.is_error:
+        return
+    error_code = "unknown"
+    message = response.text[:200]
+    try:
+        body = _json(response)
+        error_info = body.get("error", {})
+        error_code = error_info.get("code", error_code)
+        message = error_info.get("message", message)
+    except Exception:
+        pass
+    raise GraphApiError(response.status_code, error_code, message, url)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass
+class RetryPolicy:
+    """Retry schedule for throttled and transient Graph failures.
+
+    ``Retry-After`` wins when the server sends it; otherwise the delay is
+    exponential backoff with full jitter, capped at ``max_delay``.
+    """
+
+    max_retries: int = 6
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUS_CODES
+
+    def should_retry(self, attempt: int, status_code: int | None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        retry_after_seconds = _parse_retry_after(retry_after)
+        if retry_after_seconds is not None:
+            return retry_after_seconds
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every Graph client in the process.
+
+    :meth:`reserve` hands out the delay a caller must wait before sending, so
+    the same bucket serves blocking and asyncio clients. :meth:`pause` is
+    called on a throttling response and holds back all callers together.
+    A ``rate`` of 0 turns pacing off; pauses still apply. Without a ``rate``
+    the bucket reads :func:`_env_request_rate` on first use. ``burst``
+    defaults to twice the rate.
+    """
+
+    def __init__(self, rate: float | None = None, burst: int | None = None):
+        self.rate = rate
+        self.burst = burst or max(1, int((rate or 0) * 2))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def configure(self, rate: float, burst: int | None = None) -> None:
+        """Change the rate in place; clients already holding the bucket follow."""
+        with self._lock:
+            self._set_rate(rate, burst)
+
+    def _set_rate(self, rate: float, burst: int | None) -> None:
+        first = self.rate is None
+        self.rate = rate
+        self.burst = burst or max(1, int(rate * 2))
+        self._tokens = float(self.burst) if first else min(self._tokens, float(self.burst))
+
+    def reserve(self) -> tuple[float, float]:
+        """Return ``(pacing, throttle)`` seconds to wait; at most one is non-zero.
+
+        Pacing is the bucket running dry; throttle is a :meth:`pause` that
+        outlasts it.
+        """
+        with self._lock:
+            if self.rate is None:
+                self._set_rate(_env_request_rate(), None)
+            now = time.monotonic()
+            paused = max(self._paused_until - now, 0.0)
+            if self.rate <= 0:
+                return 0.0, paused
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            deficit = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if paused > deficit:
+                return 0.0, paused
+            return deficit, 0.0
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            # Resume at the sustained rate rather than with a full burst.
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = now
+
+
+def _env_request_rate() -> float:
+    """``MICROSOFT_GRAPH_RATE_LIMIT`` in requests per second, else the default.
+
+    Read lazily so a malformed value cannot break imports or ``--help``.
+    """
+    value = os.environ.get("MICROSOFT_GRAPH_RATE_LIMIT", "").strip()
+    if not value:
+        return DEFAULT_REQUESTS_PER_SECOND
+    try:
+        rate = float(value)
+    except ValueError:
+        rate = math.nan
+    if not (rate > 0 and math.isfinite(rate)):
+        print(
+            f"warning: ignoring MICROSOFT_GRAPH_RATE_LIMIT={value!r} (expected "
+            f"requests per second > 0), using {DEFAULT_REQUESTS_PER_SECOND:g}",
+            file=sys.stderr,
+        )
+        return DEFAULT_REQUESTS_PER_SECOND
+    return rate
+
+
+@dataclass
+class RequestStats:
+    """Per-client request counters: retries, waits and cache hits.
+
+    ``pacing_seconds`` is time held back by the token bucket;
+    ``throttle_seconds`` is Retry-After / backoff after 429s and errors.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    pacing_seconds: float = 0.0
+    throttle_seconds: float = 0.0
+    cache_hits: int = 0
+
+
+class ResponseCache:
+    """Opt-in conditional-GET cache for Graph responses, stored on disk.
+
+    Entries are keyed by the full request URL (query params included) plus a
+    namespace (the ``.env`` path, so accounts never share responses) and keep
+    the ``ETag`` / ``Last-Modified`` validators. Repeat requests send
+    ``If-None-Match`` / ``If-Modified-Since``, and a ``304`` is answered with
+    the stored body. Responses without validators are not stored.
+    """
+
+    _REPLAY_HEADERS = ("content-type", "etag", "last-modified")
+
+    def __init__(self, root: Path = HTTP_CACHE_DIR):
+        self.root = root
+
+    def key(self, namespace: str, url: str, params: dict[str, Any] | None) -> str:
+        full_url = httpx.URL(url).copy_merge_params(params or {})
+        return hashlib.sha256(f"{namespace}|{full_url}".encode()).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        base = self.root / key[:2] / key
+        return base.with_suffix(".json"), base.with_suffix(".body")
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        meta_path, body_path = self._paths(key)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            return orjson.loads(meta_path.read_bytes())
+        except orjson.JSONDecodeError:
+            return None
+
+    def validators(self, key: str) -> dict[str, str]:
+        entry = self._read(key)
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last-modified"):
+            headers["If-Modified-Since"] = entry["last-modified"]
+        return headers
+
+    def replay(self, key: str, request: httpx.Request) -> httpx.Response | None:
+        entry = self._read(key)
+        if entry is None:
+            return None
+        _, body_path = self._paths(key)
+        headers = {name: entry[name] for name in self._REPLAY_HEADERS if entry.get(name)}
+        return httpx.Response(
+            200, headers=headers, content=body_path.read_bytes(), request=request
+        )
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        entry = {
+            name: response.headers[name]
+            for name in self._REPLAY_HEADERS
+            if name in response.headers
+        }
+        if not entry.get("etag") and not entry.get("last-modified"):
+            return
+        entry["url"] = str(response.request.url)
+        meta_path, body_path = self._paths(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        # Body first, then meta: a reader never sees validators without a body.
+        for path, data in ((body_path, response.content), (meta_path, orjson.dumps(entry))):
+            tmp_path = path.with_name(
+                f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+
+
+_VALIDATOR_HEADERS = frozenset({"if-none-match", "if-modified-since"})
+
+
+def _without_validators(headers: dict[str, str] | None) -> dict[str, str]:
+    return {
+        name: value
+        for name, value in (headers or {}).items()
+        if name.lower() not in _VALIDATOR_HEADERS
+    }
+
+
+class QuickXorHash:
+    """Incremental ``quickXorHash`` as reported by OneDrive for Business / SharePoint.
+
+    Byte ``i`` is XORed into a 160-bit circular register at bit
+    ``(i * 11) % 160``. That offset repeats every 160 bytes, so ``update``
+    XOR-folds input into one 160-byte row with big-int arithmetic and the
+    per-byte shifts are applied once in :meth:`digest`.
+    """
+
+    WIDTH_BITS = 160
+    SHIFT = 11
+    _ROW_BYTES = WIDTH_BITS
+
+    def __init__(self) -> None:
+        self._row = 0
+        self._length = 0
+
+    def update(self, data: bytes) -> None:
+        if not data:
+            return
+        offset = self._length % self._ROW_BYTES
+        self._length += len(data)
+        # Leading zero padding aligns the chunk to the row; zeros are XOR-neutral.
+        value = int.from_bytes(data, "little") << (offset * 8)
+        rows = -(-(offset + len(data)) // self._ROW_BYTES)
+        while rows > 1:
+            half = -(-rows // 2)
+            shift = half * self._ROW_BYTES * 8
+            value = (value & ((1 << shift) - 1)) ^ (value >> shift)
+            rows = half
+        self._row ^= value
+
+    def digest(self) -> bytes:
+        mask = (1 << self.WIDTH_BITS) - 1
+        register = 0
+        for index, byte in enumerate(self._row.to_bytes(self._ROW_BYTES, "little")):
+            if byte:
+                shifted = byte << ((index * self.SHIFT) % self.WIDTH_BITS)
+                register ^= (shifted | (shifted >> self.WIDTH_BITS)) & mask
+        result = bytearray(register.to_bytes(self.WIDTH_BITS // 8, "little"))
+        for index, byte in enumerate(self._length.to_bytes(8, "little")):
+            result[len(result) - 8 + index] ^= byte
+        return bytes(result)
+
+    def b64digest(self) -> str:
+        return base64.b64encode(self.digest()).decode("ascii")
+
+
+def _verify_hashes(
+    actual: dict[str, str], expected: dict[str, str], url: str
+) -> None:
+    for name, value in actual.items():
+        remote = expected.get(name)
+        if not remote:
+            continue
+        # sha1Hash is hex (case-insensitive); quickXorHash is base64.
+        if name == "sha1Hash" and remote.upper() == value or remote == value:
+            continue
+        raise IntegrityError(url, name, value, remote)
+
+
+def batch_response_json(item: dict[str, Any], url: str) -> dict[str, Any]:
+    """Return the JSON body of a ``$batch`` sub-response or raise ``GraphApiError``."""
+    status = int(item.get("status", 0))
+    body = item.get("body")
+    if status >= 400:
+        error_info = body.get("error", {}) if isinstance(body, dict) else {}
+        raise GraphApiError(
+            status,
+            error_info.get("code", "unknown"),
+            error_info.get("message", str(body)[:200]),
+            url,
+        )
+    return body if isinstance(body, dict) else {}
+
+
+class _BatchRun:
+    """Bookkeeping for one ``batch()`` call: chunking, ``dependsOn`` and retries.
+
+    Requests are packed into chunks of ``GRAPH_BATCH_LIMIT`` in input order. A
+    request joins a chunk only once every dependency has either succeeded in
+    an earlier chunk or sits in the same chunk; dependencies satisfied by an
+    earlier chunk are dropped from ``dependsOn``. Dependents of a failed
+    request get a synthetic 424, mirroring Graph's own behaviour.
+    """
+
+    def __init__(self, requests: list[dict[str, Any]], policy: RetryPolicy):
+        ids = [str(request["id"]) for request in requests]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Batch request ids must be unique")
+        for request in requests:
+            missing = set(request.get("dependsOn", [])) - set(ids)
+            if missing:
+                raise ValueError(
+                    f"Batch request {request['id']} depends on unknown id(s): "
+                    f"{sorted(missing)}"
+                )
+        self.policy = policy
+        self.order = {request_id: index for index, request_id in enumerate(ids)}
+        self.requests = {str(request["id"]): request for request in requests}
+        self.pending = list(ids)
+        self.attempts = dict.fromkeys(ids, 0)
+        self.results: dict[str, dict[str, Any]] = {}
+
+    @property
+    def done(self) -> bool:
+        return not self.pending
+
+    def _failed(self, request_id: str) -> bool:
+        result = self.results.get(request_id)
+        return result is not None and int(result.get("status", 0)) >= 400
+
+    def next_chunk(self) -> list[dict[str, Any]]:
+        chunk: list[dict[str, Any]] = []
+        chunk_ids: set[str] = set()
+        for request_id in list(self.pending):
+            if len(chunk) >= GRAPH_BATCH_LIMIT:
+                break
+            request = self.requests[request_id]
+            depends_on = [str(dep) for dep in request.get("dependsOn", [])]
+            if any(self._failed(dep) for dep in depends_on):
+                self.pending.remove(request_id)
+                self.results[request_id] = {
+                    "id": request_id,
+                    "status": 424,
+                    "headers": {},
+                    "body": {"error": {"code": "FailedDependency", "message": ""}},
+                }
+                continue
+            if not all(dep in self.results or dep in chunk_ids for dep in depends_on):
+                continue
+            sub_request = {
+                key: value for key, value in request.items() if key != "dependsOn"
+            }
+            sub_request["id"] = request_id
+            sub_request.setdefault("method", "GET")
+            in_chunk = [dep for dep in depends_on if dep in chunk_ids]
+            if in_chunk:
+                sub_request["dependsOn"] = in_chunk
+            chunk.append(sub_request)
+            chunk_ids.add(request_id)
+        if not chunk and self.pending:
+            raise ValueError(
+                f"Batch requests have cyclic dependsOn: {sorted(self.pending)}"
+            )
+        return chunk
+
+    def record(
+        self, chunk: list[dict[str, Any]], responses: list[dict[str, Any]]
+    ) -> tuple[int, float]:
+        """Store sub-responses and re-queue retryable ones.
+
+        Returns how many sub-requests were re-queued and the backoff delay.
+        """
+        by_id = {str(item.get("id")): item for item in responses}
+        retry_ids: set[str] = set()
+        throttled = 0
+        delay = 0.0
+        for sub_request in chunk:
+            request_id = sub_request["id"]
+            item = by_id.get(request_id) or {"id": request_id, "status": 500, "body": {}}
+            status = int(item.get("status", 0))
+            if self.policy.should_retry(self.attempts[request_id], status):
+                headers = {k.lower(): v for k, v in (item.get("headers") or {}).items()}
+                delay = max(
+                    delay,
+                    self.policy.delay(self.attempts[request_id], headers.get("retry-after")),
+                )
+                self.attempts[request_id] += 1
+                retry_ids.add(request_id)
+                throttled += 1
+                continue
+            self.results[request_id] = item
+        for sub_request in chunk:
+            request_id = sub_request["id"]
+            if request_id in retry_ids:
+                continue
+            # Dependents that only failed because a throttled request did.
+            status = int(self.results[request_id].get("status", 0))
+            if status == 424 and retry_ids.intersection(sub_request.get("dependsOn", [])):
+                del self.results[request_id]
+                retry_ids.add(request_id)
+        sent = {sub_request["id"] for sub_request in chunk}
+        self.pending = sorted(
+            [request_id for request_id in self.pending if request_id not in sent]
+            + list(retry_ids),
+            key=self.order.__getitem__,
+        )
+        return throttled, delay
+
+    def ordered_results(self) -> dict[str, dict[str, Any]]:
+        return {
+            request_id: self.results[request_id]
+            for request_id in sorted(self.results, key=self.order.__getitem__)
+        }
+
+
+@dataclass
+class RequestRecord:
+    """One traced Graph call, covering all of its retries.
+
+    ``path`` is a template with IDs replaced by placeholders, and ``status``
+    is 0 when no response arrived at all. ``latency`` is time on the wire only
+    (every attempt's send, plus the body for streamed downloads);
+    ``pacing_wait`` is time the token bucket held the request back, and
+    ``throttle_wait`` is time spent in throttling pauses, Retry-After and
+    backoff. All are seconds.
+    """
+
+    method: str
+    path: str
+    status: int = 0
+    latency: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    throttled: int = 0
+    pacing_wait: float = 0.0
+    throttle_wait: float = 0.0
+    cache_hit: bool = False
+    timestamp: float = field(default_factory=time.time)
+
+
+RequestHook = Callable[[RequestRecord], None]
+_REQUEST_HOOKS: list[RequestHook] = []
+
+
+def add_request_hook(hook: RequestHook) -> None:
+    """Register a callable that receives a ``RequestRecord`` per Graph call."""
+    _REQUEST_HOOKS.append(hook)
+
+
+def remove_request_hook(hook: RequestHook) -> None:
+    if hook in _REQUEST_HOOKS:
+        _REQUEST_HOOKS.remove(hook)
+
+
+def emit_request_record(record: RequestRecord) -> None:
+    for hook in list(_REQUEST_HOOKS):
+        hook(record)
+
+
+# Path segments that are followed by an opaque ID in Graph URLs.
+_ID_PARENT_SEGMENTS = frozenset(
+    {
+        "drives",
+        "groups",
+        "items",
+        "lists",
+        "notebooks",
+        "pages",
+        "resources",
+        "sectionGroups",
+        "sections",
+        "sites",
+        "users",
+    }
+)
+
+
+def _path_template(url: str) -> str:
+    """Collapse IDs and item paths so requests to one endpoint group together."""
+    parts = urlsplit(url)
+    path = unquote(parts.path)
+    base_path = urlsplit(GRAPH_BASE).path
+    if parts.netloc == urlsplit(GRAPH_BASE).netloc and path.startswith(base_path):
+        path = path[len(base_path):]
+    path = re.sub(r"(root:)/[^:]*(:?)", r"\1{path}\2", path)
+    path = re.sub(r"\(q='.*?'\)", "(q={query})", path)
+    segments = path.split("/")
+    for index in range(1, len(segments)):
+        if segments[index - 1] in _ID_PARENT_SEGMENTS and segments[index]:
+            segments[index] = "{id}"
+    return "/".join(segments)
+
+
+class RequestCollector:
+    """In-process request hook that keeps records and summarises them."""
+
+    def __init__(self) -> None:
+        self.records: list[RequestRecord] = []
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, record: RequestRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> str:
+        with self._lock:
+            records = list(self.records)
+        wall = time.perf_counter() - self.started
+        if not records:
+            return f"Graph requests: 0 in {wall:.1f}s"
+        latencies = sorted(record.latency for record in records)
+        received = sum(record.response_bytes for record in records)
+        sent = sum(record.request_bytes for record in records)
+        in_requests = sum(latencies)
+        lines = [
+            f"Graph requests: {len(records)} in {wall:.1f}s wall "
+            f"(retries {sum(r.retries for r in records)}, "
+            f"throttled {sum(r.throttled for r in records)}, "
+            f"cache hits {sum(r.cache_hit for r in records)}, "
+            f"errors {sum(r.status == 0 or r.status >= 400 for r in records)})",
+            f"latency: p50 {_percentile(latencies, 50) * 1000:.0f}ms  "
+            f"p95 {_percentile(latencies, 95) * 1000:.0f}ms  "
+            f"max {latencies[-1] * 1000:.0f}ms  "
+            f"(total {in_requests:.1f}s in requests)",
+            f"bytes: sent {_format_bytes(sent)}, received {_format_bytes(received)} "
+            f"({_format_bytes(received / wall if wall > 0 else 0)}/s)",
+            f"waits: throttle {sum(r.throttle_wait for r in records):.1f}s, "
+            f"pacing {sum(r.pacing_wait for r in records):.1f}s",
+            "slowest endpoints (by total time):",
+        ]
+        by_endpoint: dict[str, list[float]] = {}
+        for record in records:
+            by_endpoint.setdefault(f"{record.method} {record.path}", []).append(record.latency)
+        ranked = sorted(by_endpoint.items(), key=lambda kv: sum(kv[1]), reverse=True)
+        for endpoint, values in ranked[:10]:
+            values.sort()
+            lines.append(
+                f"  {len(values):>6}x  p50 {_percentile(values, 50) * 1000:>6.0f}ms  "
+                f"p95 {_percentile(values, 95) * 1000:>6.0f}ms  "
+                f"total {sum(values):>7.1f}s  {endpoint}"
+            )
+        return "\n".join(lines)
+
+
+class JsonlTraceWriter:
+    """Request hook that appends one JSON line per Graph call to a file."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._handle = path.open("ab")
+        self._lock = threading.Lock()
+
+    def __call__(self, record: RequestRecord) -> None:
+        line = orjson.dumps(asdict(record)) + b"\n"
+        with self._lock:
+            self._handle.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
+
+
+def _wire_bytes(response: httpx.Response, body_size: int | None = None) -> int:
+    # Compressed size on the wire when the transport tracks it, else body size.
+    if response.num_bytes_downloaded:
+        return response.num_bytes_downloaded
+    if body_size is not None:
+        return body_size
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return 0
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size:.0f} B"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@contextmanager
+def request_tracing(
+    trace_path: str | Path | None = None, *, print_stats: bool = False
+) -> Iterator[RequestCollector | None]:
+    """Trace Graph traffic for the duration of a CLI command.
+
+    ``trace_path`` appends JSONL records; ``print_stats`` prints a latency,
+    throughput and cache-hit summary to stderr on exit.
+    """
+    writer = JsonlTraceWriter(Path(trace_path)) if trace_path else None
+    collector = RequestCollector() if print_stats else None
+    for hook in (writer, collector):
+        if hook is not None:
+            add_request_hook(hook)
+    try:
+        yield collector
+    finally:
+        for hook in (writer, collector):
+            if hook is not None:
+                remove_request_hook(hook)
+        if writer is not None:
+            writer.close()
+        if collector is not None:
+            print(collector.summary(), file=sys.stderr)
+
+
+GRAPH_RATE_LIMITER = TokenBucket()
+
+
 class GraphClient:
+    """Graph API client that reuses one pooled, keep-alive HTTP connection set.
+
+    The underlying ``httpx.Client`` is created lazily on the first request and
+    closed by :meth:`close`, on context-manager exit, or at interpreter exit.
+    """
+
     def __init__(
         self,
         env_path: str | Path | None,
         scopes: tuple[str, ...],
         *,
         allow_interactive: bool | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        response_cache: ResponseCache | None = None,
     ):
         self.env_path = Path(env_path) if env_path else DEFAULT_ENV_PATH
         self.scopes = scopes
         self.allow_interactive = (
             allow_interactive if allow_interactive is not None else sys.stdin.isatty()
         )
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter or GRAPH_RATE_LIMITER
+        self.response_cache = response_cache
+        self.stats = RequestStats()
         self._headers: dict[str, str] | None = None
+        self._force_refresh = False
+        # Worker threads share one client: build the pool and refresh the
+        # token once, not once per thread that finds them missing.
+        self._token_lock = threading.Lock()
+        self._http_lock = threading.Lock()
+        self._http: httpx.Client | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    def __enter__(self) -> GraphClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def http(self) -> httpx.Client:
+        http = self._http
+        if http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = _build_http_client(
+                        self.max_connections, self.keepalive_expiry, self.http2
+                    )
+                    self._finalizer = weakref.finalize(self, self._http.close)
+                http = self._http
+        return http
+
+    def close(self) -> None:
+        """Close pooled connections. The pool is recreated on the next request."""
+        with self._http_lock:
+            if self._finalizer is not None:
+                self._finalizer()
+                self._finalizer = None
+            self._http = None
 
     @property
     def headers(self) -> dict[str, str]:
-        if self._headers is None:
-            token = get_access_token(
-                self.env_path, self.scopes, allow_interactive=self.allow_interactive
-            )
-            self._headers = {"Authorization": f"Bearer {token}"}
-        return self._headers
+        headers = self._headers
+        if headers is None:
+            with self._token_lock:
+                if self._headers is None:
+                    token = get_access_token(
+                        self.env_path,
+                        self.scopes,
+                        allow_interactive=self.allow_interactive,
+                        force_refresh=self._force_refresh,
+                    )
+                    self._headers = {"Authorization": f"Bearer {token}"}
+                    self._force_refresh = False
+                headers = self._headers
+        return headers
 
-    def _invalidate_token(self) -> None:
-        self._headers = None
+    def _invalidate_token(self, stale: dict[str, str]) -> None:
+        with self._token_lock:
+            # Another thread may already have replaced the stale token.
+            if self._headers is stale:
+                self._headers = None
+                self._force_refresh = True
+
+    def _wait(self, seconds: float, *, pacing: bool = False) -> float:
+        if seconds > 0:
+            if pacing:
+                self.stats.pacing_seconds += seconds
+            else:
+                self.stats.throttle_seconds += seconds
+            time.sleep(seconds)
+        return max(seconds, 0.0)
 
     def _request(
         self,
@@ -152,71 +1136,211 @@ class GraphClient:
         timeout: int = 30,
         follow_redirects: bool = False,
         extra_headers: dict[str, str] | None = None,
+        stream: bool = False,
+        record: RequestRecord | None = None,
     ) -> httpx.Response:
-        url = f"{GRAPH_BASE}{path}" if path.startswith("/") else path
-        headers = {**self.headers, **(extra_headers or {})}
-        response = httpx.request(
-            method,
-            url,
-            headers=headers,
-            params=params,
-            json=json_body,
-            timeout=timeout,
-            follow_redirects=follow_redirects,
-        )
+        """Send a request with retries and report it to the request hooks.
 
-        # Retry once on 401 (token expired mid-session)
-        if response.status_code == 401 and self._headers is not None:
-            self._invalidate_token()
-            headers = {**self.headers, **(extra_headers or {})}
-            response = httpx.request(
-                method,
-                url,
-                headers=headers,
-                params=params,
-                json=json_body,
-                timeout=timeout,
-                follow_redirects=follow_redirects,
-            )
+        ``stream=True`` leaves the body unread; the caller must close the
+        response and, when it passes its own ``record``, emit it once the
+        body has been consumed.
+        """
+        url = _graph_url(path)
+        kwargs = {
+            "params": params,
+            "json_body": json_body,
+            "timeout": timeout,
+            "follow_redirects": follow_redirects,
+            "extra_headers": extra_headers,
+            "stream": stream,
+        }
+        if record is not None:
+            return self._send(method, url, record, **kwargs)
+        record = RequestRecord(method, _path_template(url))
+        try:
+            response = self._send(method, url, record, **kwargs)
+            if not record.cache_hit and not stream:
+                record.response_bytes = _wire_bytes(response)
+            return response
+        finally:
+            emit_request_record(record)
 
-        if response.is_error:
-            error_code = "unknown"
-            message = response.text[:200]
+    def _send(
+        self,
+        method: str,
+        url: str,
+        record: RequestRecord,
+        *,
+        params: dict[str, Any] | None,
+        json_body: dict[str, Any] | list[Any] | None,
+        timeout: int,
+        follow_redirects: bool,
+        extra_headers: dict[str, str] | None,
+        stream: bool,
+        conditional: bool = True,
+    ) -> httpx.Response:
+        stats = self.stats
+        stats.requests += 1
+        cache_key: str | None = None
+        request_headers = extra_headers
+        if self.response_cache is not None and method == "GET" and not stream:
+            cache_key = self.response_cache.key(str(self.env_path.resolve()), url, params)
+            if conditional:
+                validators = self.response_cache.validators(cache_key)
+                extra_headers = {**(extra_headers or {}), **validators}
+        attempt = 0
+        token_refreshed = False
+        while True:
+            pacing, throttle = self.rate_limiter.reserve()
+            record.pacing_wait += self._wait(pacing, pacing=True)
+            record.throttle_wait += self._wait(throttle)
+            auth_headers = self.headers
+            headers = {**auth_headers, **(extra_headers or {})}
+            http = self.http
             try:
-                body = response.json()
-                error_info = body.get("error", {})
-                error_code = error_info.get("code", error_code)
-                message = error_info.get("message", message)
-            except Exception:
-                pass
-            raise GraphApiError(response.status_code, error_code, message, url)
+                request = http.build_request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=json_body,
+                    timeout=timeout,
+                )
+                record.request_bytes = len(request.content)
+                sent = time.perf_counter()
+                try:
+                    response = http.send(
+                        request, stream=stream, follow_redirects=follow_redirects
+                    )
+                finally:
+                    record.latency += time.perf_counter() - sent
+            except httpx.TransportError:
+                if not self.retry_policy.should_retry(attempt, None):
+                    raise
+                delay = self.retry_policy.delay(attempt)
+            else:
+                # Refresh once on 401 (token expired mid-session)
+                if response.status_code == 401 and not token_refreshed:
+                    response.close()
+                    token_refreshed = True
+                    self._invalidate_token(auth_headers)
+                    continue
+                if not self.retry_policy.should_retry(attempt, response.status_code):
+                    break
+                response.close()
+                delay = self.retry_policy.delay(
+                    attempt, response.headers.get("Retry-After")
+                )
+                if response.status_code in THROTTLE_STATUS_CODES:
+                    stats.throttled += 1
+                    record.throttled += 1
+                    self.rate_limiter.pause(delay)
+            attempt += 1
+            stats.retries += 1
+            record.retries += 1
+            record.throttle_wait += self._wait(delay)
 
+        record.status = response.status_code
+        if response.is_error and stream:
+            response.read()
+            response.close()
+        if response.status_code == 304:
+            cached = (
+                self.response_cache.replay(cache_key, response.request)
+                if cache_key is not None
+                else None
+            )
+            if cached is not None:
+                stats.cache_hits += 1
+                record.cache_hit = True
+                return cached
+            if conditional:
+                # No body to replay (the entry was evicted after its
+                # validators were sent, or the caller sent its own):
+                # fetch once more without validators.
+                response.close()
+                return self._send(
+                    method,
+                    url,
+                    record,
+                    params=params,
+                    json_body=json_body,
+                    timeout=timeout,
+                    follow_redirects=follow_redirects,
+                    extra_headers=_without_validators(request_headers),
+                    stream=stream,
+                    conditional=False,
+                )
+        _raise_for_graph_error(response, url)
+        if cache_key is not None and response.status_code == 200:
+            self.response_cache.store(cache_key, response)
         return response
 
     def get_json(
-        self, path: str, *, params: dict[str, Any] | None = None
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        select: Sequence[str] | None = None,
     ) -> dict[str, Any]:
-        return self._request("GET", path, params=params).json()
+        return _json(self._request("GET", path, params=_with_select(params, select)))
 
-    def get_all(
+    def iter_all(
         self,
         path: str,
         *,
         params: dict[str, Any] | None = None,
+        select: Sequence[str] | None = None,
         extra_headers: dict[str, str] | None = None,
-    ) -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
-        next_url: str | None = f"{GRAPH_BASE}{path}" if path.startswith("/") else path
-        next_params = params
+    ) -> Iterator[dict[str, Any]]:
+        """Yield collection items page by page, following ``@odata.nextLink`` lazily.
+
+        ``select`` becomes a ``$select`` projection so Graph only returns the
+        listed fields; ``nextLink`` URLs carry it forward.
+        """
+        next_url: str | None = _graph_url(path)
+        next_params = _with_select(params, select)
         while next_url:
             response = self._request(
                 "GET", next_url, params=next_params, extra_headers=extra_headers
             )
-            payload = response.json()
-            results.extend(payload.get("value", []))
+            payload = _json(response)
             next_url = payload.get("@odata.nextLink")
             next_params = None
-        return results
+            yield from payload.get("value", [])
+
+    def get_all(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        select: Sequence[str] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        return list(
+            self.iter_all(path, params=params, select=select, extra_headers=extra_headers)
+        )
+
+    def get_delta(
+        self, path: str, *, select: Sequence[str] | None = None
+    ) -> tuple[list[dict[str, Any]], str]:
+        """Follow a delta query to its last page. Returns (changes, deltaLink).
+
+        ``path`` is either a ``.../delta`` resource or a saved ``deltaLink``;
+        a saved link already carries its query, so ``select`` only applies to
+        the first round. An expired link surfaces as ``GraphApiError`` 410.
+        """
+        next_url: str = _graph_url(path)
+        next_params = _with_select(None, select)
+        changes: list[dict[str, Any]] = []
+        while True:
+            payload = _json(self._request("GET", next_url, params=next_params))
+            next_params = None
+            changes.extend(payload.get("value", []))
+            if "@odata.nextLink" in payload:
+                next_url = payload["@odata.nextLink"]
+                continue
+            return changes, payload["@odata.deltaLink"]
 
     def get_text(self, path: str, *, timeout: int = 60) -> str:
         return self._request("GET", path, timeout=timeout).text
@@ -233,6 +1357,404 @@ class GraphClient:
         *,
         timeout: int = 30,
     ) -> dict[str, Any]:
-        return self._request(
-            "POST", path, json_body=body, timeout=timeout
-        ).json()
+        return _json(self._request("POST", path, json_body=body, timeout=timeout))
+
+    def download(
+        self,
+        path: str,
+        target: Path,
+        *,
+        timeout: int = 120,
+        expected_hashes: dict[str, str] | None = None,
+    ) -> dict[str, str]:
+        """Stream ``path`` into ``target`` without buffering the whole body.
+
+        Chunks go to a temp file next to ``target`` that is renamed into place
+        only after the download completes, so readers never see partial files.
+        ``quickXorHash`` and ``sha1Hash`` are computed while streaming and
+        checked against ``expected_hashes`` (Graph's ``file.hashes``) when
+        given; a mismatch raises ``IntegrityError``. Returns the computed hashes.
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        quick_xor = QuickXorHash()
+        sha1 = hashlib.sha1(usedforsecurity=False)
+        # A plain open() keeps the umask-based mode (mkstemp would force 0600).
+        tmp_path = target.with_name(
+            f".{target.name}.{os.getpid()}.{threading.get_ident()}.part"
+        )
+        record = RequestRecord("GET", _path_template(_graph_url(path)))
+        try:
+            with tmp_path.open("wb") as handle:
+                response = self._request(
+                    "GET",
+                    path,
+                    timeout=timeout,
+                    follow_redirects=True,
+                    stream=True,
+                    record=record,
+                )
+                written = 0
+                streamed = time.perf_counter()
+                try:
+                    for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        handle.write(chunk)
+                        quick_xor.update(chunk)
+                        sha1.update(chunk)
+                        written += len(chunk)
+                finally:
+                    response.close()
+                    record.latency += time.perf_counter() - streamed
+                    record.response_bytes = _wire_bytes(response, written)
+            hashes = {
+                "quickXorHash": quick_xor.b64digest(),
+                "sha1Hash": sha1.hexdigest().upper(),
+            }
+            _verify_hashes(hashes, expected_hashes or {}, _graph_url(path))
+            tmp_path.replace(target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            emit_request_record(record)
+        return hashes
+
+    def batch(
+        self, requests: list[dict[str, Any]], *, timeout: int = 60
+    ) -> dict[str, dict[str, Any]]:
+        """Send sub-requests through ``POST /$batch``, 20 per round-trip.
+
+        ``requests`` use Graph's JSON batch shape: ``id``, ``url`` relative to
+        the API version (``/me/drive``), optional ``method``, ``headers``,
+        ``body`` and ``dependsOn``. Throttled sub-requests are retried per the
+        client's ``RetryPolicy``. Returns sub-responses keyed by ``id`` in
+        input order; use :func:`batch_response_json` to unwrap them.
+        """
+        run = _BatchRun(requests, self.retry_policy)
+        while not run.done:
+            chunk = run.next_chunk()
+            payload = self.post_json("/$batch", {"requests": chunk}, timeout=timeout)
+            throttled, delay = run.record(chunk, payload.get("responses", []))
+            if throttled:
+                self.stats.throttled += throttled
+                self.stats.retries += throttled
+                self.rate_limiter.pause(delay)
+                self._wait(delay)
+        return run.ordered_results()
+
+
+class AsyncGraphClient:
+    """asyncio counterpart of :class:`GraphClient`.
+
+    In-flight requests are bounded per host by a semaphore, and token
+    acquisition is serialized behind a lock so a burst of coroutines that all
+    hit a 401 triggers a single refresh.
+    """
+
+    def __init__(
+        self,
+        env_path: str | Path | None,
+        scopes: tuple[str, ...],
+        *,
+        allow_interactive: bool | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
+        self.env_path = Path(env_path) if env_path else DEFAULT_ENV_PATH
+        self.scopes = scopes
+        self.allow_interactive = (
+            allow_interactive if allow_interactive is not None else sys.stdin.isatty()
+        )
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.per_host_concurrency = per_host_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter or GRAPH_RATE_LIMITER
+        self.response_cache = response_cache
+        self.stats = RequestStats()
+        self._headers: dict[str, str] | None = None
+        self._force_refresh = False
+        import asyncio
+
+        self._token_lock = asyncio.Lock()
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._http: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> AsyncGraphClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = _build_async_http_client(
+                self.max_connections, self.keepalive_expiry, self.http2
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close pooled connections. The pool is recreated on the next request."""
+        if self._http is not None:
+            http, self._http = self._http, None
+            await http.aclose()
+
+    async def _get_headers(self, stale: dict[str, str] | None = None) -> dict[str, str]:
+        import asyncio
+
+        async with self._token_lock:
+            # Another coroutine may already have replaced the stale token.
+            if stale is not None and self._headers is stale:
+                self._headers = None
+                self._force_refresh = True
+            if self._headers is None:
+                token = await asyncio.to_thread(
+                    get_access_token,
+                    self.env_path,
+                    self.scopes,
+                    allow_interactive=self.allow_interactive,
+                    force_refresh=self._force_refresh,
+                )
+                self._headers = {"Authorization": f"Bearer {token}"}
+                self._force_refresh = False
+            return self._headers
+
+    async def _wait(self, seconds: float, *, pacing: bool = False) -> float:
+        if seconds > 0:
+            import asyncio
+
+            if pacing:
+                self.stats.pacing_seconds += seconds
+            else:
+                self.stats.throttle_seconds += seconds
+            await asyncio.sleep(seconds)
+        return max(seconds, 0.0)
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            import asyncio
+
+            semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | list[Any] | None = None,
+        timeout: int = 30,
+        follow_redirects: bool = False,
+        extra_headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        url = _graph_url(path)
+        record = RequestRecord(method, _path_template(url))
+        try:
+            response = await self._send(
+                method,
+                url,
+                record,
+                params=params,
+                json_body=json_body,
+                timeout=timeout,
+                follow_redirects=follow_redirects,
+                extra_headers=extra_headers,
+            )
+            if not record.cache_hit:
+                record.response_bytes = _wire_bytes(response)
+            return response
+        finally:
+            emit_request_record(record)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        record: RequestRecord,
+        *,
+        params: dict[str, Any] | None,
+        json_body: dict[str, Any] | list[Any] | None,
+        timeout: int,
+        follow_redirects: bool,
+        extra_headers: dict[str, str] | None,
+        conditional: bool = True,
+    ) -> httpx.Response:
+        stats = self.stats
+        stats.requests += 1
+        cache_key: str | None = None
+        request_headers = extra_headers
+        if self.response_cache is not None and method == "GET":
+            cache_key = self.response_cache.key(str(self.env_path.resolve()), url, params)
+            if conditional:
+                validators = self.response_cache.validators(cache_key)
+                extra_headers = {**(extra_headers or {}), **validators}
+        attempt = 0
+        token_refreshed = False
+        auth_headers = await self._get_headers()
+        while True:
+            pacing, throttle = self.rate_limiter.reserve()
+            record.pacing_wait += await self._wait(pacing, pacing=True)
+            record.throttle_wait += await self._wait(throttle)
+            try:
+                request = self.http.build_request(
+                    method,
+                    url,
+                    headers={**auth_headers, **(extra_headers or {})},
+                    params=params,
+                    json=json_body,
+                    timeout=timeout,
+                )
+                record.request_bytes = len(request.content)
+                async with self._host_semaphore(url):
+                    sent = time.perf_counter()
+                    try:
+                        response = await self.http.send(
+                            request, follow_redirects=follow_redirects
+                        )
+                    finally:
+                        record.latency += time.perf_counter() - sent
+            except httpx.TransportError:
+                if not self.retry_policy.should_retry(attempt, None):
+                    raise
+                delay = self.retry_policy.delay(attempt)
+            else:
+                # Refresh once on 401 (token expired mid-session)
+                if response.status_code == 401 and not token_refreshed:
+                    token_refreshed = True
+                    auth_headers = await self._get_headers(stale=auth_headers)
+                    continue
+                if not self.retry_policy.should_retry(attempt, response.status_code):
+                    break
+                delay = self.retry_policy.delay(
+                    attempt, response.headers.get("Retry-After")
+                )
+                if response.status_code in THROTTLE_STATUS_CODES:
+                    stats.throttled += 1
+                    record.throttled += 1
+                    self.rate_limiter.pause(delay)
+            attempt += 1
+            stats.retries += 1
+            record.retries += 1
+            record.throttle_wait += await self._wait(delay)
+
+        record.status = response.status_code
+        if response.status_code == 304:
+            cached = (
+                self.response_cache.replay(cache_key, response.request)
+                if cache_key is not None
+                else None
+            )
+            if cached is not None:
+                stats.cache_hits += 1
+                record.cache_hit = True
+                return cached
+            if conditional:
+                # No body to replay: fetch once more without validators.
+                return await self._send(
+                    method,
+                    url,
+                    record,
+                    params=params,
+                    json_body=json_body,
+                    timeout=timeout,
+                    follow_redirects=follow_redirects,
+                    extra_headers=_without_validators(request_headers),
+                    conditional=False,
+                )
+        _raise_for_graph_error(response, url)
+        if cache_key is not None and response.status_code == 200:
+            self.response_cache.store(cache_key, response)
+        return response
+
+    async def get_json(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        select: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        response = await self._request("GET", path, params=_with_select(params, select))
+        return _json(response)
+
+    async def iter_all(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        select: Sequence[str] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Async counterpart of :meth:`GraphClient.iter_all`."""
+        next_url: str | None = _graph_url(path)
+        next_params = _with_select(params, select)
+        while next_url:
+            response = await self._request(
+                "GET", next_url, params=next_params, extra_headers=extra_headers
+            )
+            payload = _json(response)
+            next_url = payload.get("@odata.nextLink")
+            next_params = None
+            for item in payload.get("value", []):
+                yield item
+
+    async def get_all(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        select: Sequence[str] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        return [
+            item
+            async for item in self.iter_all(
+                path, params=params, select=select, extra_headers=extra_headers
+            )
+        ]
+
+    async def get_text(self, path: str, *, timeout: int = 60) -> str:
+        return (await self._request("GET", path, timeout=timeout)).text
+
+    async def get_bytes(self, path: str, *, timeout: int = 60) -> bytes:
+        response = await self._request(
+            "GET", path, timeout=timeout, follow_redirects=True
+        )
+        return response.content
+
+    async def post_json(
+        self,
+        path: str,
+        body: dict[str, Any] | list[Any],
+        *,
+        timeout: int = 30,
+    ) -> dict[str, Any]:
+        response = await self._request("POST", path, json_body=body, timeout=timeout)
+        return _json(response)
+
+    async def batch(
+        self, requests: list[dict[str, Any]], *, timeout: int = 60
+    ) -> dict[str, dict[str, Any]]:
+        """Async counterpart of :meth:`GraphClient.batch`."""
+        run = _BatchRun(requests, self.retry_policy)
+        while not run.done:
+            chunk = run.next_chunk()
+            payload = await self.post_json(
+                "/$batch", {"requests": chunk}, timeout=timeout
+            )
+            throttled, delay = run.record(chunk, payload.get("responses", []))
+            if throttled:
+                self.stats.throttled += throttled
+                self.stats.retries += throttled
+                self.rate_limiter.pause(delay)
+                await self._wait(delay)
+        return run.ordered_results()
@@ -0,0 +1,303 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "beautifulsoup4",
+#     "httpxyz",
+#     "lxml",
+#     "markdownify",
+#     "orjson",
+#     "python-dotenv",
+# ]
+# ///
+"""
+Offline micro-benchmarks for the msgraph-explore scripts.
+
+Nothing here talks to Microsoft Graph; payloads are synthesized locally.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+import orjson
+
+_PAGE_SELECT = ("id", "title", "lastModifiedDateTime")
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# Loaded on demand only; importing any of them at CLI start is a regression.
+_DEFERRED_MODULES = ("msal", "markdownify", "bs4", "markitdown", "asyncio")
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def _synthetic_page(index: int) -> dict[str, Any]:
+    """A OneNote page object shaped like an unprojected Graph listing entry."""
+    site = "contoso.sharepoint.com,0a1b2c3d-0000-4000-8000-000000000001,9f8e7d6c"
+    page_id = f"1-{index:032x}!{index % 97}-{index:08x}"
+    base = f"https://graph.microsoft.com/v1.0/sites/{site}/onenote"
+    return {
+        "id": page_id,
+        "self": f"{base}/pages/{page_id}",
+        "createdDateTime": "2024-01-02T03:04:05Z",
+        "title": f"Design review {index} — 会议记录",
+        "createdByAppId": "WLID-000000004C12AE6F",
+        "contentUrl": f"{base}/pages/{page_id}/content",
+        "lastModifiedDateTime": "2024-06-07T08:09:10Z",
+        "level": index % 3,
+        "order": index,
+        "links": {
+            "oneNoteClientUrl": {
+                "href": f"onenote:https://contoso.sharepoint.com/sites/x/Notebook/{index}.one"
+            },
+            "oneNoteWebUrl": {
+                "href": f"https://contoso.sharepoint.com/sites/x/_layouts/Doc.aspx?id={index}"
+            },
+        },
+        "parentSection@odata.context": f"{base}/$metadata#sections/$entity",
+        "parentSection": {
+            "id": f"1-{index % 40:032x}",
+            "displayName": f"Section {index % 40}",
+            "self": f"{base}/sections/1-{index % 40:032x}",
+        },
+    }
+
+
+def _synthetic_listing(count: int, select: tuple[str, ...] | None) -> bytes:
+    pages = [_synthetic_page(index) for index in range(count)]
+    if select:
+        pages = [{key: page[key] for key in select} for page in pages]
+    context = "https://graph.microsoft.com/v1.0/$metadata#pages"
+    return orjson.dumps({"@odata.context": context, "value": pages})
+
+
+def _time(func: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _bench_json(args: argparse.Namespace) -> int:
+    full = _synthetic_listing(args.items, None)
+    projected = _synthetic_listing(args.items, _PAGE_SELECT)
+    rows = [
+        # httpx's Response.json() decodes to str, then runs stdlib json.
+        ("stdlib json, full", full, lambda: json.loads(full.decode("utf-8"))),
+        ("orjson, full", full, lambda: orjson.loads(full)),
+        ("stdlib json, $select", projected, lambda: json.loads(projected.decode("utf-8"))),
+        ("orjson, $select", projected, lambda: orjson.loads(projected)),
+    ]
+    print(f"{args.items} OneNote page entries, median of {args.repeat} runs")
+    print(f"{'decoder':<22} {'payload':>10} {'time':>10} {'MB/s':>8}")
+    for label, payload, func in rows:
+        elapsed = _time(func, args.repeat)
+        size_mb = len(payload) / 1_000_000
+        print(f"{label:<22} {size_mb:>8.2f}MB {elapsed * 1000:>8.1f}ms {size_mb / elapsed:>8.0f}")
+    return 0
+
+
+def _synthetic_onenote_html(tables: int, rows: int) -> str:
+    """A table-heavy page in the shape the OneNote content API returns."""
+    parts = [
+        '<html lang="en-US"><head><title>Bench page</title></head>'
+        '<body data-absolute-enabled="true" style="font-family:Calibri;font-size:11pt">'
+        '<div id="div:{bench}" data-id="_default" style="position:absolute;left:48px;top:115px">'
+    ]
+    for table in range(tables):
+        parts.append(f'<h2 style="margin:0">Table {table}</h2>')
+        parts.append(
+            f'<p data-tag="to-do" style="margin:0">Follow up {table}</p>'
+            f'<p data-tag="to-do:completed" style="margin:0">Done {table}</p>'
+            f'<p>See <a href="onenote:#Design%20review%20{table}&amp;section-id={{x}}">review</a>'
+            f' and <a href="https://contoso.sharepoint.com/doc/{table}">the spec</a>.</p>'
+        )
+        parts.append('<table border="1" style="border-collapse:collapse;border-style:solid">')
+        for row in range(rows):
+            parts.append(
+                f'<tr><td style="border:1pt solid">Row {row}</td>'
+                f'<td style="border:1pt solid"><p style="margin:0">Owner <span style="font-weight:bold">{row % 7}</span></p></td>'
+                f'<td style="border:1pt solid"><ul><li>item a{row}</li><li>item b{row}</li></ul></td>'
+                f'<td style="border:1pt solid">{"值 " * (row % 5)}</td></tr>'
+            )
+        parts.append("</table>")
+    parts.append("</div></body></html>")
+    return "".join(parts)
+
+
+def _legacy_html_to_markdown(html: str) -> str:
+    """The regex + double-parse converter html_to_markdown replaced, as a baseline."""
+    from bs4 import BeautifulSoup, NavigableString
+    from markdownify import markdownify
+
+    from msgraph_fetch import _sanitize_filename
+
+    html = re.sub(
+        r'<p[^>]*data-tag="to-do"[^>]*>(.*?)</p>', r"<li>[ ] \1</li>", html, flags=re.DOTALL
+    )
+    html = re.sub(
+        r'<p[^>]*data-tag="to-do:completed"[^>]*>(.*?)</p>',
+        r"<li>[x] \1</li>",
+        html,
+        flags=re.DOTALL,
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    for table in soup.find_all("table"):
+        if table.find("thead") or table.find("th"):
+            continue
+        first_tr = table.find("tr")
+        if not first_tr:
+            continue
+        for td in first_tr.find_all("td"):
+            td.name = "th"
+        thead = soup.new_tag("thead")
+        first_tr.wrap(thead)
+        remaining_trs = table.find_all("tr")
+        if remaining_trs:
+            tbody = soup.new_tag("tbody")
+            for tr in remaining_trs:
+                tbody.append(tr.extract())
+            table.append(tbody)
+    for cell in soup.find_all(["td", "th"]):
+        for ul in cell.find_all(["ul", "ol"]):
+            items = [li.get_text(strip=True) for li in ul.find_all("li")]
+            ul.replace_with(NavigableString("; ".join(items)))
+    for link in soup.find_all("a", href=True):
+        match = re.match(r"onenote:#(.+?)&", link["href"])
+        if match:
+            link["href"] = f"{_sanitize_filename(unquote(match.group(1)))}.md"
+    markdown = markdownify(str(soup), heading_style="ATX", strip=["style", "script"])
+    return re.sub(r"\n{3,}", "\n\n", markdown).strip()
+
+
+def _bench_convert(args: argparse.Namespace) -> int:
+    import msgraph_fetch
+
+    html = _synthetic_onenote_html(args.tables, args.rows)
+    baseline = _legacy_html_to_markdown(html)
+    parsers = ["html.parser"] + (["lxml"] if find_spec("lxml") else [])
+    rows: list[tuple[str, Callable[[], str]]] = [
+        ("legacy (regex + 2 parses)", lambda: _legacy_html_to_markdown(html))
+    ]
+    for parser in parsers:
+
+        def convert(parser: str = parser) -> str:
+            msgraph_fetch._HTML_PARSER = parser
+            return msgraph_fetch.html_to_markdown(html)
+
+        rows.append((f"single parse, {parser}", convert))
+
+    size_kb = len(html.encode("utf-8")) / 1024
+    print(f"{args.tables} tables x {args.rows} rows, {size_kb:.0f} KB HTML, median of {args.repeat} runs")
+    print(f"{'converter':<28} {'time':>10} {'speedup':>8}  output")
+    reference = None
+    for label, func in rows:
+        output = func()
+        elapsed = _time(func, args.repeat)
+        reference = reference or elapsed
+        same = "identical" if output == baseline else f"differs ({len(output)} vs {len(baseline)} chars)"
+        print(f"{label:<28} {elapsed * 1000:>8.1f}ms {reference / elapsed:>7.2f}x  {same}")
+    return 0
+
+
+def _importtime(module: str) -> list[tuple[int, str, int]]:
+    """Return ``(depth, name, cumulative µs)`` for ``module`` and everything it imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            entries.append((len(match[3]) // 2, match[4], int(match[2])))
+    # Children are printed before their parent; the subtree ends at ``module``.
+    end = max(index for index, entry in enumerate(entries) if entry[1] == module)
+    start = end
+    while start > 0 and entries[start - 1][0] > 0:
+        start -= 1
+    return entries[start : end + 1]
+
+
+def _bench_import_time(args: argparse.Namespace) -> int:
+    failures = []
+    for module in args.module:
+        runs = [_importtime(module) for _ in range(args.repeat)]
+        total_ms = statistics.median(run[-1][2] for run in runs) / 1000
+        print(f"{module}: {total_ms:.1f}ms (median of {args.repeat}, budget {args.budget_ms:g}ms)")
+        for depth, name, cumulative in reversed(runs[-1][:-1]):
+            if depth <= 2 and cumulative >= args.min_ms * 1000:
+                print(f"  {cumulative / 1000:>8.1f}ms  {'  ' * (depth - 1)}{name}")
+        imported = {name.partition(".")[0] for _, name, _ in runs[-1]}
+        eager = [name for name in _DEFERRED_MODULES if name in imported]
+        if eager:
+            failures.append(f"{module} imports {', '.join(eager)} at startup")
+        if total_ms > args.budget_ms:
+            failures.append(f"{module} takes {total_ms:.1f}ms to import (> {args.budget_ms:g}ms)")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Offline msgraph-explore benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bench_json = subparsers.add_parser(
+        "json", help="Decode large listing payloads (stdlib json vs orjson, $select)"
+    )
+    bench_json.add_argument("--items", type=int, default=20000)
+    bench_json.add_argument("--repeat", type=int, default=5)
+    bench_json.set_defaults(handler=_bench_json)
+
+    bench_convert = subparsers.add_parser(
+        "convert", help="OneNote HTML to Markdown: legacy converter vs single parse"
+    )
+    bench_convert.add_argument("--tables", type=int, default=40)
+    bench_convert.add_argument("--rows", type=int, default=50)
+    bench_convert.add_argument("--repeat", type=int, default=5)
+    bench_convert.set_defaults(handler=_bench_convert)
+
+    import_time = subparsers.add_parser(
+        "import-time",
+        help="Check CLI import cost against a budget (python -X importtime)",
+    )
+    import_time.add_argument(
+        "--module",
+        action="append",
+        default=None,
+        help="Module to import (repeatable; default: msgraph_fetch and msgraph_search)",
+    )
+    import_time.add_argument("--budget-ms", type=float, default=250.0)
+    import_time.add_argument("--repeat", type=int, default=5)
+    import_time.add_argument(
+        "--min-ms", type=float, default=2.0, help="Hide imports cheaper than this"
+    )
+    import_time.set_defaults(handler=_bench_import_time)
+
+    return parser
+
+
+def main() -> int:
+    parser = _build_parser()
+    args = parser.parse_args()
+    if getattr(args, "module", False) is None:
+        args.module = ["msgraph_fetch", "msgraph_search"]
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,6 +3,7 @@
 # dependencies = [
 #     "beautifulsoup4",
 #     "httpxyz",
+#     "lxml",
 #     "markdownify",
 #     "markitdown[docx,pptx,xlsx,pdf]",
 #     "msal",
@@ -17,28 +18,74 @@ Fetch and sync content from SharePoint, OneDrive, and OneNote via Microsoft Grap
 from __future__ import annotations
 
 import argparse
+import base64
+import binascii
 import hashlib
+import os
 import re
+import shutil
+import sqlite3
+import stat
 import sys
+import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import quote, unquote, urlsplit
 
 import orjson
-from markdownify import markdownify
 
 from msgraph_auth import (
     CACHE_ROOT,
     DEFAULT_ENV_PATH,
+    DEFAULT_MAX_CONNECTIONS,
     DRIVE_SCOPES,
+    GRAPH_RATE_LIMITER,
     NOTES_SCOPES,
     AuthError,
     GraphApiError,
     GraphClient,
+    IntegrityError,
+    ResponseCache,
+    batch_response_json,
+    request_tracing,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
 DEFAULT_FETCH_OUTPUT_DIR = CACHE_ROOT / "materialized" / "files"
+# How cached Drive files are exposed in output directories; see _materialize.
+MATERIALIZE_MODES = ("copy", "hardlink", "reflink", "symlink")
+# OneNote images and attachments, content-addressed by SHA-1.
+ASSET_STORE_DIR = CACHE_ROOT / "assets"
+_ASSET_WORKERS = 4
+# Drive file bodies, content-addressed by the hashes Graph reports in file.hashes.
+BLOB_STORE_DIR = CACHE_ROOT / "blobs"
+
+# $select projections: only the fields these scripts read.
+_SITE_FIELDS = ("id", "displayName", "webUrl")
+_NOTEBOOK_FIELDS = ("id", "displayName")
+_SECTION_FIELDS = ("id", "displayName", "lastModifiedDateTime")
+_SECTION_GROUP_FIELDS = ("id", "displayName")
+_PAGE_FIELDS = ("id", "title", "lastModifiedDateTime")
+_DRIVE_FIELDS = ("id", "name")
+_DRIVE_ITEM_FIELDS = ("name", "size", "id", "file", "folder", "eTag", "cTag", "webUrl")
+_DRIVE_DELTA_FIELDS = (*_DRIVE_ITEM_FIELDS, "parentReference", "deleted", "root", "package")
+
+# Whole notebook hierarchy in one listing; nested groups repeat via $levels.
+_TREE_SECTIONS = f"sections($select={','.join(_SECTION_FIELDS)})"
+_TREE_GROUPS = f"$select={','.join(_SECTION_GROUP_FIELDS)};$expand={_TREE_SECTIONS}"
+_NOTEBOOK_TREE_EXPAND = (
+    f"{_TREE_SECTIONS},sectionGroups({_TREE_GROUPS},"
+    f"sectionGroups($levels=max;{_TREE_GROUPS}))"
+)
 
 _CONVERTIBLE_EXTS = frozenset(
     {".docx", ".pptx", ".xlsx", ".xls", ".pdf", ".html", ".htm"}
@@ -86,23 +133,392 @@ def _read_meta(meta_path: Path) -> dict[str, Any]:
     return {}
 
 
+def _write_atomic(target: Path, data: bytes) -> None:
+    """Write through a sibling temp file so readers never see a partial file."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(
+        f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        tmp_path.write_bytes(data)
+        tmp_path.replace(target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _write_meta(meta_path: Path, meta: dict[str, Any]) -> None:
-    meta_path.parent.mkdir(parents=True, exist_ok=True)
-    meta_path.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+    _write_atomic(meta_path, orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+
+
+class MetaIndex:
+    """Per-item cache metadata in one SQLite database (WAL mode).
+
+    Records are JSON documents keyed by ``(kind, scope, key)``: ``kind`` is
+    ``drive_item``, ``onenote_page``, ``onenote_resource`` or ``wiki_page``;
+    ``scope`` is the drive / site cache key used by the on-disk layout; ``key``
+    is the Graph ID. Each thread gets its own connection, and WAL lets readers
+    run alongside a writer across threads and processes.
+
+    Opening an index that predates the current schema migrates it; version 1
+    imports (and removes) the per-item JSON files earlier versions wrote under
+    ``meta/``, version 2 adds ``accessed_at`` for LRU eviction. Per-folder
+    documents (delta state, notebook manifests) stay JSON.
+    """
+
+    SCHEMA_VERSION = 2
+    # Reads refresh accessed_at at most this often, so most cache hits stay read-only.
+    _TOUCH_INTERVAL = 3600.0
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or CACHE_ROOT / "meta" / "index.sqlite3"
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._migrate(conn)
+            self._local.conn = conn
+        return conn
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= self.SCHEMA_VERSION:
+            return
+        imported: list[Path] = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-read under the write lock: another process may have migrated.
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS records (
+                        kind TEXT NOT NULL,
+                        scope TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        data BLOB NOT NULL,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (kind, scope, key)
+                    ) WITHOUT ROWID
+                    """
+                )
+                imported = self._import_json_meta(conn)
+            if version < 2:
+                conn.execute("ALTER TABLE records ADD COLUMN accessed_at REAL")
+                conn.execute("UPDATE records SET accessed_at = updated_at")
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        for path in imported:
+            path.unlink(missing_ok=True)
+        for folder in {path.parent for path in imported}:
+            try:
+                folder.rmdir()
+            except OSError:
+                pass
+
+    def _import_json_meta(self, conn: sqlite3.Connection) -> list[Path]:
+        meta_root = self.path.parent
+        sources = (
+            ("drive_item", meta_root.glob("drive/*/*.json")),
+            ("onenote_page", meta_root.glob("onenote/*/pages/*.json")),
+            ("onenote_resource", meta_root.glob("onenote/*/resources/*.json")),
+        )
+        imported: list[Path] = []
+        for kind, paths in sources:
+            for path in paths:
+                try:
+                    record = orjson.loads(path.read_bytes())
+                    updated_at = path.stat().st_mtime
+                except (OSError, orjson.JSONDecodeError):
+                    continue
+                if kind == "drive_item":
+                    # File names are hashed item IDs; the ID is in the record.
+                    scope, key = path.parent.name, record.get("item_id", path.stem)
+                else:
+                    scope, key = path.parent.parent.name, path.stem
+                conn.execute(
+                    "INSERT OR IGNORE INTO records VALUES (?, ?, ?, ?, ?)",
+                    (kind, scope, key, orjson.dumps(record), updated_at),
+                )
+                imported.append(path)
+        return imported
+
+    def get(self, kind: str, scope: str, key: str) -> dict[str, Any]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT data, accessed_at FROM records WHERE kind = ? AND scope = ? AND key = ?",
+            (kind, scope, key),
+        ).fetchone()
+        if row is None:
+            return {}
+        now = time.time()
+        if now - (row[1] or 0) > self._TOUCH_INTERVAL:
+            conn.execute(
+                "UPDATE records SET accessed_at = ? WHERE kind = ? AND scope = ? AND key = ?",
+                (now, kind, scope, key),
+            )
+        return orjson.loads(row[0])
+
+    def put(self, kind: str, scope: str, key: str, record: dict[str, Any]) -> None:
+        now = time.time()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO records (kind, scope, key, data, updated_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (kind, scope, key, orjson.dumps(record), now, now),
+        )
+
+    def records(self) -> list[tuple[str, str, str, dict[str, Any], float]]:
+        """Every record as ``(kind, scope, key, data, accessed_at)``."""
+        rows = self._connection().execute(
+            "SELECT kind, scope, key, data, accessed_at FROM records"
+        ).fetchall()
+        return [
+            (kind, scope, key, orjson.loads(data), accessed_at)
+            for kind, scope, key, data, accessed_at in rows
+        ]
+
+    def counts(self) -> dict[str, int]:
+        rows = self._connection().execute(
+            "SELECT kind, COUNT(*) FROM records GROUP BY kind ORDER BY kind"
+        ).fetchall()
+        return dict(rows)
+
+    def delete(self, keys: list[tuple[str, str, str]]) -> None:
+        """Remove ``(kind, scope, key)`` records in one transaction."""
+        if not keys:
+            return
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "DELETE FROM records WHERE kind = ? AND scope = ? AND key = ?", keys
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def _file_sha1(path: Path) -> str:
+    digest = hashlib.sha1(usedforsecurity=False)
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest().upper()
 
 
-def _copy_if_needed(source: Path, target: Path) -> Path:
+def _is_materialized(
+    source: Path, target: Path, mode: str, sha1_hash: str | None
+) -> bool:
+    """Decide from metadata alone (plus one hash read at most) if ``target`` is current.
+
+    A regular file is also accepted for ``hardlink`` and ``symlink``: that is
+    what ``_materialize`` leaves when linking fell back to a copy, and
+    checking it like a copy keeps later runs from copying it again.
+    """
+    try:
+        target_stat = target.lstat()
+    except FileNotFoundError:
+        return False
+    if stat.S_ISLNK(target_stat.st_mode):
+        return mode == "symlink" and target.readlink() == source.resolve()
+    source_stat = source.stat()
+    if mode == "hardlink" and os.path.samestat(source_stat, target_stat):
+        return True
+    if target_stat.st_size != source_stat.st_size:
+        return False
+    if target_stat.st_mtime_ns == source_stat.st_mtime_ns:
+        return True
+    # Same size, different mtime (e.g. touched or copied by another tool):
+    # trust the stored hash instead of re-copying.
+    if sha1_hash and _file_sha1(target) == sha1_hash.upper():
+        os.utime(target, ns=(target_stat.st_atime_ns, source_stat.st_mtime_ns))
+        return True
+    return False
+
+
+def _reflink(source: Path, target: Path) -> None:
+    """Clone ``source`` into ``target`` sharing extents (btrfs, XFS, bcachefs).
+
+    Raises ``OSError`` where the filesystem or platform cannot clone.
+    """
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        raise OSError(f"reflink is not supported on {sys.platform}") from None
+
+    ficlone = 0x40049409  # _IOW(0x94, 9, int), linux/fs.h
+    with source.open("rb") as src, target.open("wb") as dst:
+        fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+
+
+def _materialize(
+    source: Path,
+    target: Path,
+    mode: str = "copy",
+    *,
+    sha1_hash: str | None = None,
+) -> Path:
+    """Expose a cached source file at ``target`` using ``mode``.
+
+    ``copy`` duplicates the bytes (kernel-side via ``shutil.copyfile``) and
+    stamps the source mtime so later runs can skip it on size + mtime,
+    falling back to ``sha1_hash``. ``hardlink`` and ``symlink`` share the
+    cache file; edits to the target then change the cache too. ``reflink``
+    clones extents copy-on-write. Link and clone modes fall back to ``copy``
+    where the filesystem cannot do them.
+    """
+    if _is_materialized(source, target, mode, sha1_hash):
+        return target.resolve() if mode != "symlink" else target.absolute()
     target.parent.mkdir(parents=True, exist_ok=True)
-    source_bytes = source.read_bytes()
-    if not target.exists() or target.read_bytes() != source_bytes:
-        target.write_bytes(source_bytes)
-    return target.resolve()
+    tmp_path = target.with_name(
+        f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        if mode == "copy":
+            shutil.copyfile(source, tmp_path)
+        else:
+            try:
+                if mode == "hardlink":
+                    os.link(source, tmp_path)
+                elif mode == "symlink":
+                    tmp_path.symlink_to(source.resolve())
+                else:
+                    _reflink(source, tmp_path)
+            except OSError:
+                # Cross-device link, no symlink privilege, no reflink support.
+                tmp_path.unlink(missing_ok=True)
+                shutil.copyfile(source, tmp_path)
+        if not tmp_path.is_symlink():
+            source_stat = source.stat()
+            os.utime(tmp_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        tmp_path.replace(target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return target.resolve() if mode != "symlink" else target.absolute()
+
+
+def _asset_path(sha1_hash: str, suffix: str) -> Path:
+    digest = sha1_hash.lower()
+    return ASSET_STORE_DIR / digest[:2] / f"{digest}{suffix}"
+
+
+def _blob_paths(hashes: dict[str, str] | None) -> list[Path]:
+    """Blob store addresses for Graph ``file.hashes``, SHA-1 first.
+
+    OneDrive personal reports ``sha1Hash`` (hex); SharePoint / OneDrive for
+    Business report ``quickXorHash`` (base64, stored as hex so it is a safe
+    file name).
+    """
+    hashes = hashes or {}
+    keys: list[tuple[str, str]] = []
+    if sha1_hash := hashes.get("sha1Hash"):
+        keys.append(("sha1", sha1_hash.lower()))
+    if quick_xor := hashes.get("quickXorHash"):
+        try:
+            keys.append(("quickxor", base64.b64decode(quick_xor, validate=True).hex()))
+        except binascii.Error:
+            pass
+    return [BLOB_STORE_DIR / algo / digest[:2] / digest for algo, digest in keys]
+
+
+def _link_blob(blob: Path, aliases: list[Path]) -> None:
+    """Hard-link ``blob`` under its other hash addresses; best effort."""
+    for alias in aliases:
+        if alias == blob or alias.exists():
+            continue
+        alias.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(blob, alias)
+        except OSError:
+            pass
 
 
 def _persist_text_if_needed(target: Path, content: str) -> None:
-    target.parent.mkdir(parents=True, exist_ok=True)
     if not target.exists() or target.read_text(encoding="utf-8") != content:
-        target.write_text(content, encoding="utf-8")
+        _write_atomic(target, content.encode("utf-8"))
+
+
+@contextmanager
+def _worker_pool(workers: int) -> Iterator[ThreadPoolExecutor]:
+    """Thread pool that drops still-queued work if the caller raises."""
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        yield pool
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
+
+
+def _resolved(value: str) -> Future[str]:
+    future: Future[str] = Future()
+    future.set_result(value)
+    return future
+
+
+class ConversionPool:
+    """Runs HTML to Markdown conversion inline or on a bounded process pool.
+
+    With ``processes`` > 0, conversions run in worker processes so they use
+    every core and never hold the GIL of the downloading threads. ``submit``
+    blocks once ``max_pending`` conversions are queued, which keeps fast
+    downloads from piling up unconverted pages in memory. Workers are spawned,
+    not forked: the pool starts them lazily from download threads that hold
+    HTTP, TLS and SQLite state a forked child must not inherit.
+    """
+
+    def __init__(self, processes: int = 0, *, max_pending: int | None = None):
+        self.processes = processes
+        self._pool: ProcessPoolExecutor | None = None
+        self._slots: threading.BoundedSemaphore | None = None
+        if processes > 0:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            self._slots = threading.BoundedSemaphore(max_pending or processes * 4)
+
+    def __enter__(self) -> ConversionPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def submit(self, func: Callable[..., str], *args: Any) -> Future[str]:
+        if self._pool is None or self._slots is None:
+            future: Future[str] = Future()
+            try:
+                future.set_result(func(*args))
+            except Exception as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            return future
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+_INLINE_CONVERSION = ConversionPool()
 
 
 def _encode_graph_path(path: str) -> str:
@@ -112,67 +528,220 @@ def _encode_graph_path(path: str) -> str:
     return quote(stripped, safe="/!$&'()*+,;=:@")
 
 
-def _preprocess_onenote_html(html: str) -> str:
-    from bs4 import BeautifulSoup, NavigableString
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    for table in soup.find_all("table"):
-        if table.find("thead") or table.find("th"):
-            continue
-        first_tr = table.find("tr")
-        if not first_tr:
-            continue
-        for td in first_tr.find_all("td"):
-            td.name = "th"
-        thead = soup.new_tag("thead")
-        first_tr.wrap(thead)
-        remaining_trs = table.find_all("tr")
-        if remaining_trs:
-            tbody = soup.new_tag("tbody")
-            for tr in remaining_trs:
-                tbody.append(tr.extract())
-            table.append(tbody)
-
-    for cell in soup.find_all(["td", "th"]):
-        for ul in cell.find_all(["ul", "ol"]):
-            items = [li.get_text(strip=True) for li in ul.find_all("li")]
-            ul.replace_with(NavigableString("; ".join(items)))
-
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        if not href.startswith("onenote:"):
+# lxml builds the tree several times faster than html.parser; it is optional.
+_HTML_PARSER = "lxml" if find_spec("lxml") else "html.parser"
+_TODO_TAGS = {"to-do": "[ ] ", "to-do:completed": "[x] "}
+_RESOURCE_ID = re.compile(r"/onenote/resources/([^/\s\"'<>]+)/\$value")
+_RESOURCE_TAG = re.compile(r"<(?:img|object)\b[^>]*>", re.IGNORECASE)
+_TAG_ATTR = re.compile(r"([\w:-]+)=\"([^\"]*)\"")
+_RESOURCE_URL_ATTRS = ("data-fullres-src", "src", "data")
+_RESOURCE_TYPE_ATTRS = ("data-fullres-src-type", "data-src-type", "type")
+
+
+def _promote_table_header(soup: Any, table: Any) -> None:
+    if table.find("thead") or table.find("th"):
+        return
+    first_tr = table.find("tr")
+    if not first_tr:
+        return
+    for td in first_tr.find_all("td"):
+        td.name = "th"
+    thead = soup.new_tag("thead")
+    first_tr.wrap(thead)
+    remaining_trs = table.find_all("tr")
+    if remaining_trs:
+        tbody = soup.new_tag("tbody")
+        for tr in remaining_trs:
+            tbody.append(tr.extract())
+        table.append(tbody)
+
+
+def page_resources(html: str) -> dict[str, str]:
+    """Map each resource referenced by ``<img>``/``<object>`` to a file suffix.
+
+    Images point at the full-resolution copy when OneNote provides one.
+    The suffix comes from the attachment name or the declared MIME type.
+    """
+    import mimetypes
+
+    resources: dict[str, str] = {}
+    for tag in _RESOURCE_TAG.findall(html):
+        attrs = dict(_TAG_ATTR.findall(tag))
+        for name in _RESOURCE_URL_ATTRS:
+            match = _RESOURCE_ID.search(attrs.get(name, ""))
+            if match:
+                break
+        else:
             continue
-        match = re.match(r"onenote:#(.+?)&", href)
+        suffix = Path(attrs.get("data-attachment", "")).suffix.lower()
+        if not suffix:
+            mime = next((attrs[n] for n in _RESOURCE_TYPE_ATTRS if attrs.get(n)), "")
+            suffix = mimetypes.guess_extension(mime) or ""
+        resources.setdefault(match.group(1), suffix)
+    return resources
+
+
+def _resource_link(tag: Any) -> tuple[str, str] | None:
+    """Return (resource_id, url) for the preferred resource URL of a tag."""
+    for name in _RESOURCE_URL_ATTRS:
+        match = _RESOURCE_ID.search(tag.get(name, ""))
         if match:
-            title = unquote(match.group(1))
-            link["href"] = f"{_sanitize_filename(title)}.md"
+            return match.group(1), tag[name]
+    return None
+
+
+def _in_table_cell(tag: Any) -> bool:
+    parent = tag.parent
+    while parent is not None:
+        if parent.name in ("td", "th"):
+            return True
+        parent = parent.parent
+    return False
+
+
+def _rewrite_onenote_tree(soup: Any, assets: dict[str, str]) -> None:
+    """Apply the OneNote-specific rewrites in a single walk of the parsed tree.
+
+    To-do paragraphs become task list items, header-less tables get their
+    first row promoted, lists inside cells are flattened to ``; ``-joined
+    text, and ``onenote:`` links point at the synced ``.md`` file. Images
+    and attachments point at their local copy in ``assets`` when present.
+    """
+    from bs4 import NavigableString
+
+    for tag in soup.find_all(True):
+        name = tag.name
+        if name == "p":
+            marker = _TODO_TAGS.get(tag.get("data-tag"))
+            if marker:
+                tag.name = "li"
+                tag.attrs = {}
+                tag.insert(0, NavigableString(marker))
+        elif name == "table":
+            _promote_table_header(soup, tag)
+        elif name in ("ul", "ol"):
+            # Lists nested in an already-flattened list are detached by now.
+            if _in_table_cell(tag):
+                items = [li.get_text(strip=True) for li in tag.find_all("li")]
+                tag.replace_with(NavigableString("; ".join(items)))
+        elif name == "a" and tag.get("href", "").startswith("onenote:"):
+            match = re.match(r"onenote:#(.+?)&", tag["href"])
+            if match:
+                title = unquote(match.group(1))
+                tag["href"] = f"{_sanitize_filename(title)}.md"
+        elif name == "img":
+            resource = _resource_link(tag)
+            if resource and resource[0] in assets:
+                tag["src"] = assets[resource[0]]
+        elif name == "object":
+            resource = _resource_link(tag)
+            if resource:
+                # markdownify drops <object>; keep attachments as links.
+                href = assets.get(resource[0], resource[1])
+                link = soup.new_tag("a", href=href)
+                link.string = tag.get("data-attachment") or Path(href).name
+                tag.replace_with(link)
+
+
+def html_to_markdown(html: str, assets: dict[str, str] | None = None) -> str:
+    """Convert OneNote page HTML to Markdown with a single HTML parse.
+
+    ``assets`` maps resource IDs to local files (see ``page_resources``).
+    """
+    from bs4 import BeautifulSoup
+    from markdownify import MarkdownConverter
+
+    soup = BeautifulSoup(html, _HTML_PARSER)
+    _rewrite_onenote_tree(soup, assets or {})
+    converter = MarkdownConverter(heading_style="ATX", strip=["style", "script"])
+    markdown = converter.convert_soup(soup)
+    markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+    return markdown.strip()
 
-    return str(soup)
 
+def _iter_tree_sections(
+    node: dict[str, Any], groups: tuple[str, ...] = ()
+) -> Iterator[tuple[tuple[str, ...], dict[str, Any]]]:
+    """Yield (section group names, section) for a notebook or section group node."""
+    for section in node.get("sections", []):
+        yield groups, section
+    for group in node.get("sectionGroups", []):
+        yield from _iter_tree_sections(group, (*groups, group.get("displayName", "group")))
 
-def html_to_markdown(html: str) -> str:
-    html = re.sub(
-        r'<p[^>]*data-tag="to-do"[^>]*>(.*?)</p>',
-        r"<li>[ ] \1</li>",
-        html,
-        flags=re.DOTALL,
-    )
-    html = re.sub(
-        r'<p[^>]*data-tag="to-do:completed"[^>]*>(.*?)</p>',
-        r"<li>[x] \1</li>",
-        html,
-        flags=re.DOTALL,
-    )
-    html = _preprocess_onenote_html(html)
-    markdown = markdownify(html, heading_style="ATX", strip=["style", "script"])
-    markdown = re.sub(r"\n{3,}", "\n\n", markdown)
-    return markdown.strip()
+
+def _page_filename(page: dict[str, Any]) -> str:
+    return _sanitize_filename(page.get("title", page["id"][:12])) + ".md"
+
+
+@dataclass
+class _PendingPage:
+    """A page whose HTML is local and whose Markdown may still be converting.
+
+    ``persist`` means the Markdown is not in the derived cache yet; ``fresh``
+    means the page meta must be rewritten. ``assets`` is recorded in the meta
+    only when every resource of the page is local.
+    """
+
+    page_info: dict[str, Any]
+    markdown: Future[str]
+    persist: bool = True
+    fresh: bool = False
+    assets: dict[str, str] | None = None
+
+
+@dataclass
+class SyncReport:
+    """Page-level changes seen by an incremental notebook sync."""
+
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    skipped_sections: int = 0
+
+    def compare(
+        self, known_pages: dict[str, dict[str, Any]], pages: list[dict[str, Any]]
+    ) -> None:
+        remaining = dict(known_pages)
+        for page in pages:
+            known = remaining.pop(page["id"], None)
+            if known is None:
+                self.added += 1
+            elif known.get("lastModifiedDateTime") != page.get("lastModifiedDateTime"):
+                self.changed += 1
+        self.removed += len(remaining)
+
+    def summary(self) -> str:
+        return (
+            f"Pages: {self.added} added, {self.changed} changed, {self.removed} removed; "
+            f"{self.skipped_sections} unchanged section(s) skipped"
+        )
 
 
 class OneNoteClient:
-    def __init__(self, env_path: str | Path | None = None):
-        self.graph = GraphClient(env_path, NOTES_SCOPES)
+    def __init__(
+        self,
+        env_path: str | Path | None = None,
+        *,
+        http_cache: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        fetch_assets: bool = True,
+    ):
+        self.graph = GraphClient(
+            env_path,
+            NOTES_SCOPES,
+            max_connections=max_connections,
+            response_cache=ResponseCache() if http_cache else None,
+        )
+        self.fetch_assets = fetch_assets
+        self.meta_index = MetaIndex()
+        # One download per resource per run, however many pages embed it.
+        self._resource_lock = threading.Lock()
+        self._resource_downloads: dict[str, Future[str]] = {}
+        # Resource downloads for every page of a sync share this pool.
+        self._asset_pool: ThreadPoolExecutor | None = None
+        # Notebook hierarchies discovered this run, by site and by notebook.
+        self._notebook_trees: dict[str, list[dict[str, Any]]] = {}
+        self._notebooks: dict[str, dict[str, Any]] = {}
 
     def _source_root(self, site_id: str) -> Path:
         return CACHE_ROOT / "sources" / "onenote" / _site_cache_key(site_id)
@@ -183,28 +752,99 @@ class OneNoteClient:
     def _meta_root(self, site_id: str) -> Path:
         return CACHE_ROOT / "meta" / "onenote" / _site_cache_key(site_id)
 
+    def iter_sites(self, search: str) -> Iterator[dict[str, Any]]:
+        return self.graph.iter_all(f"/sites?search={search}", select=_SITE_FIELDS)
+
     def list_sites(self, search: str) -> list[dict[str, Any]]:
-        return self.graph.get_all(f"/sites?search={search}")
+        return list(self.iter_sites(search))
 
     def list_notebooks(self, site_id: str) -> list[dict[str, Any]]:
-        return self.graph.get_all(f"/sites/{site_id}/onenote/notebooks")
+        return self.graph.get_all(
+            f"/sites/{site_id}/onenote/notebooks", select=_NOTEBOOK_FIELDS
+        )
+
+    def notebook_tree(self, site_id: str) -> list[dict[str, Any]]:
+        """Return every notebook with its ``sections`` and nested ``sectionGroups``.
+
+        One ``$expand`` listing usually returns the whole hierarchy; any level
+        Graph leaves unexpanded is listed directly. Cached for the client's
+        lifetime.
+        """
+        tree = self._notebook_trees.get(site_id)
+        if tree is None:
+            path = f"/sites/{site_id}/onenote/notebooks"
+            try:
+                tree = self.graph.get_all(
+                    path,
+                    params={"$expand": _NOTEBOOK_TREE_EXPAND},
+                    select=_NOTEBOOK_FIELDS,
+                )
+            except GraphApiError as exc:
+                if exc.status_code != 400:
+                    raise
+                tree = self.graph.get_all(path, select=_NOTEBOOK_FIELDS)
+            for notebook in tree:
+                self._complete_tree(site_id, "notebooks", notebook)
+                self._notebooks[notebook["id"]] = notebook
+            self._notebook_trees[site_id] = tree
+        return tree
+
+    def get_notebook(self, site_id: str, notebook_id: str) -> dict[str, Any]:
+        """Return one notebook with its section hierarchy (see ``notebook_tree``)."""
+        notebook = self._notebooks.get(notebook_id)
+        if notebook is None:
+            path = f"/sites/{site_id}/onenote/notebooks/{notebook_id}"
+            try:
+                notebook = self.graph.get_json(
+                    path,
+                    params={"$expand": _NOTEBOOK_TREE_EXPAND},
+                    select=_NOTEBOOK_FIELDS,
+                )
+            except GraphApiError as exc:
+                if exc.status_code != 400:
+                    raise
+                notebook = self.graph.get_json(path, select=_NOTEBOOK_FIELDS)
+            self._complete_tree(site_id, "notebooks", notebook)
+            self._notebooks[notebook_id] = notebook
+        return notebook
+
+    def _complete_tree(self, site_id: str, kind: str, node: dict[str, Any]) -> None:
+        """Fill in the levels of ``node`` that ``$expand`` did not return."""
+        path = f"/sites/{site_id}/onenote/{kind}/{node['id']}"
+        for name, fields in (
+            ("sections", _SECTION_FIELDS),
+            ("sectionGroups", _SECTION_GROUP_FIELDS),
+        ):
+            if name not in node:
+                node[name] = self.graph.get_all(f"{path}/{name}", select=fields)
+            elif next_link := node.pop(f"{name}@odata.nextLink", None):
+                node[name].extend(self.graph.iter_all(next_link))
+        for group in node["sectionGroups"]:
+            self._complete_tree(site_id, "sectionGroups", group)
 
     def list_sections(
         self, site_id: str, notebook_id: str
     ) -> list[dict[str, Any]]:
-        return self.graph.get_all(
-            f"/sites/{site_id}/onenote/notebooks/{notebook_id}/sections"
-        )
+        """All sections of a notebook, including those inside section groups."""
+        notebook = self.get_notebook(site_id, notebook_id)
+        return [section for _, section in _iter_tree_sections(notebook)]
+
+    def iter_pages(
+        self, site_id: str, *, section_id: str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        if section_id:
+            path = f"/sites/{site_id}/onenote/sections/{section_id}/pages"
+        else:
+            path = f"/sites/{site_id}/onenote/pages"
+        return self.graph.iter_all(path, select=_PAGE_FIELDS)
 
     def list_pages(
         self, site_id: str, *, section_id: str | None = None
     ) -> list[dict[str, Any]]:
-        if section_id:
-            return self.graph.get_all(f"/sites/{site_id}/onenote/sections/{section_id}/pages")
-        return self.graph.get_all(f"/sites/{site_id}/onenote/pages")
+        return list(self.iter_pages(site_id, section_id=section_id))
 
-    def _page_meta_path(self, site_id: str, page_id: str) -> Path:
-        return self._meta_root(site_id) / "pages" / f"{page_id}.json"
+    def _notebook_manifest_path(self, site_id: str, notebook_id: str) -> Path:
+        return self._meta_root(site_id) / "notebooks" / f"{notebook_id}.json"
 
     def _page_html_path(self, site_id: str, page_id: str) -> Path:
         return self._source_root(site_id) / "pages" / f"{page_id}.html"
@@ -212,66 +852,245 @@ class OneNoteClient:
     def _page_markdown_path(self, site_id: str, page_id: str) -> Path:
         return self._derived_root(site_id) / "pages" / f"{page_id}.md"
 
+    def _store_resource(self, site_id: str, resource_id: str, suffix: str) -> str:
+        """Download a resource into the asset store unless it is already there."""
+        site_key = _site_cache_key(site_id)
+        meta = self.meta_index.get("onenote_resource", site_key, resource_id)
+        if meta:
+            target = _asset_path(meta["sha1Hash"], meta.get("suffix", ""))
+            if target.exists():
+                return str(target)
+        incoming = ASSET_STORE_DIR / "incoming" / (
+            f"{_item_cache_key(resource_id)}.{os.getpid()}.{threading.get_ident()}{suffix}"
+        )
+        hashes = self.graph.download(
+            f"/sites/{site_id}/onenote/resources/{resource_id}/$value", incoming
+        )
+        target = _asset_path(hashes["sha1Hash"], suffix)
+        if target.exists():
+            # Same bytes under another resource ID (e.g. a pasted logo).
+            incoming.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            incoming.replace(target)
+        self.meta_index.put(
+            "onenote_resource",
+            site_key,
+            resource_id,
+            {
+                "resource_id": resource_id,
+                "sha1Hash": hashes["sha1Hash"],
+                "suffix": suffix,
+                "cached_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            },
+        )
+        return str(target)
+
+    def _resource(self, site_id: str, resource_id: str, suffix: str) -> str:
+        with self._resource_lock:
+            future = self._resource_downloads.get(resource_id)
+            owner = future is None
+            if future is None:
+                future = self._resource_downloads[resource_id] = Future()
+        if owner:
+            try:
+                future.set_result(self._store_resource(site_id, resource_id, suffix))
+            except Exception as exc:  # noqa: BLE001
+                future.set_exception(exc)
+        return future.result()
+
+    def fetch_resources(self, site_id: str, resources: dict[str, str]) -> dict[str, str]:
+        """Make page images and attachments local, concurrently.
+
+        ``resources`` comes from ``page_resources``. Returns resource ID to
+        local path; resources that fail are left out and keep their remote
+        link in the Markdown.
+        """
+        if not resources:
+            return {}
+        assets: dict[str, str] = {}
+        with self._asset_downloads() as pool:
+            futures = {
+                resource_id: pool.submit(self._resource, site_id, resource_id, suffix)
+                for resource_id, suffix in resources.items()
+            }
+            for resource_id, future in futures.items():
+                try:
+                    assets[resource_id] = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    print(f"warning: resource {resource_id} not fetched: {exc}", file=sys.stderr)
+        return assets
+
+    @contextmanager
+    def _asset_downloads(self) -> Iterator[ThreadPoolExecutor]:
+        """The client's resource-download pool, created by the outermost caller.
+
+        Sync entry points open it once, so pages fetched by ``--workers``
+        threads queue their resources on ``_ASSET_WORKERS`` long-lived threads
+        instead of each starting a pool of their own.
+        """
+        if self._asset_pool is not None:
+            yield self._asset_pool
+            return
+        with _worker_pool(_ASSET_WORKERS) as pool:
+            self._asset_pool = pool
+            try:
+                yield pool
+            finally:
+                self._asset_pool = None
+
+    def _assets_current(self, assets: dict[str, str] | None) -> bool:
+        if not self.fetch_assets:
+            return True
+        return assets is not None and all(Path(path).exists() for path in assets.values())
+
+    def _convert_page(
+        self,
+        site_id: str,
+        page_info: dict[str, Any],
+        html: str,
+        converter: ConversionPool,
+    ) -> _PendingPage:
+        if not self.fetch_assets:
+            return _PendingPage(
+                page_info, converter.submit(html_to_markdown, html), fresh=True
+            )
+        resources = page_resources(html)
+        assets = self.fetch_resources(site_id, resources)
+        return _PendingPage(
+            page_info,
+            converter.submit(html_to_markdown, html, assets),
+            fresh=True,
+            assets=assets if len(assets) == len(resources) else None,
+        )
+
     def fetch_page_html(self, site_id: str, page_id: str) -> str:
         return self.graph.get_text(
             f"/sites/{site_id}/onenote/pages/{page_id}/content", timeout=60
         )
 
     def fetch_page_markdown(
-        self, site_id: str, page_id: str, *, use_cache: bool = True
+        self,
+        site_id: str,
+        page_id: str,
+        *,
+        use_cache: bool = True,
+        page_info: dict[str, Any] | None = None,
     ) -> str:
-        meta_path = self._page_meta_path(site_id, page_id)
+        """Return a page as Markdown, reusing the cached HTML when it is current.
+
+        ``page_info`` is the page's listing entry; when it already carries
+        ``lastModifiedDateTime`` the per-page metadata GET is skipped.
+        """
+        pending = self._start_page(
+            site_id, page_id, use_cache=use_cache, page_info=page_info
+        )
+        return self._finish_page(site_id, page_id, pending)
+
+    def _start_page(
+        self,
+        site_id: str,
+        page_id: str,
+        *,
+        use_cache: bool = True,
+        page_info: dict[str, Any] | None = None,
+        converter: ConversionPool | None = None,
+    ) -> _PendingPage:
+        """Make the page HTML local and hand it to ``converter``; no waiting."""
         html_path = self._page_html_path(site_id, page_id)
         markdown_path = self._page_markdown_path(site_id, page_id)
-        page_info = self.graph.get_json(f"/sites/{site_id}/onenote/pages/{page_id}")
-        last_modified = page_info.get("lastModifiedDateTime")
+        converter = converter or _INLINE_CONVERSION
+        if page_info is None or "lastModifiedDateTime" not in page_info:
+            page_info = self.graph.get_json(
+                f"/sites/{site_id}/onenote/pages/{page_id}", select=_PAGE_FIELDS
+            )
 
         if use_cache and html_path.exists():
-            meta = _read_meta(meta_path)
-            if meta.get("lastModifiedDateTime") == last_modified:
-                if markdown_path.exists():
-                    return markdown_path.read_text(encoding="utf-8")
-                markdown = html_to_markdown(html_path.read_text(encoding="utf-8"))
-                _persist_text_if_needed(markdown_path, markdown)
-                return markdown
+            meta = self.meta_index.get("onenote_page", _site_cache_key(site_id), page_id)
+            if meta.get("lastModifiedDateTime") == page_info.get("lastModifiedDateTime"):
+                if markdown_path.exists() and self._assets_current(meta.get("assets")):
+                    markdown = markdown_path.read_text(encoding="utf-8")
+                    return _PendingPage(page_info, _resolved(markdown), persist=False)
+                html = html_path.read_text(encoding="utf-8")
+                return self._convert_page(site_id, page_info, html, converter)
 
         html = self.fetch_page_html(site_id, page_id)
         _persist_text_if_needed(html_path, html)
-
-        markdown = html_to_markdown(html)
-        _persist_text_if_needed(markdown_path, markdown)
-        _write_meta(
-            meta_path,
-            {
+        return self._convert_page(site_id, page_info, html, converter)
+
+    def _finish_page(self, site_id: str, page_id: str, pending: _PendingPage) -> str:
+        markdown = pending.markdown.result()
+        if pending.persist:
+            _persist_text_if_needed(self._page_markdown_path(site_id, page_id), markdown)
+        if pending.fresh:
+            meta = {
                 "page_id": page_id,
-                "title": page_info.get("title", ""),
-                "lastModifiedDateTime": last_modified,
+                "title": pending.page_info.get("title", ""),
+                "lastModifiedDateTime": pending.page_info.get("lastModifiedDateTime"),
                 "cached_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            },
-        )
+            }
+            if pending.assets is not None:
+                meta["assets"] = pending.assets
+            self.meta_index.put("onenote_page", _site_cache_key(site_id), page_id, meta)
         return markdown
 
-    def _sync_pages(
+    def _submit_pages(
         self,
+        pool: ThreadPoolExecutor,
         site_id: str,
         pages: list[dict[str, Any]],
+        converter: ConversionPool | None,
+    ) -> list[Future[_PendingPage]]:
+        return [
+            pool.submit(
+                self._start_page,
+                site_id,
+                page["id"],
+                page_info=page,
+                converter=converter,
+            )
+            for page in pages
+        ]
+
+    def _collect_pages(
+        self,
+        site_id: str,
+        pages: list[dict[str, Any]],
+        futures: list[Future[_PendingPage]],
         output_dir: Path,
         *,
-        verbose: bool = True,
+        verbose: bool,
     ) -> list[Path]:
+        # Results are consumed in listing order, so progress output is stable
+        # whatever order the downloads and conversions finish in.
         written: list[Path] = []
         total = len(pages)
-        for index, page in enumerate(pages, start=1):
+        for index, (page, future) in enumerate(zip(pages, futures), start=1):
             title = page.get("title", page["id"][:12])
-            filename = _sanitize_filename(title) + ".md"
-            if verbose:
-                print(f"  [{index}/{total}] {title}")
-            markdown = self.fetch_page_markdown(site_id, page["id"])
-            file_path = output_dir / filename
+            markdown = self._finish_page(site_id, page["id"], future.result())
+            file_path = output_dir / _page_filename(page)
             _persist_text_if_needed(file_path, f"# {title}\n\n{markdown}")
             written.append(file_path.resolve())
+            if verbose:
+                print(f"  [{index}/{total}] {title}")
         return written
 
+    def _sync_pages(
+        self,
+        site_id: str,
+        pages: list[dict[str, Any]],
+        output_dir: Path,
+        *,
+        verbose: bool = True,
+        workers: int = 1,
+        converter: ConversionPool | None = None,
+    ) -> list[Path]:
+        with self._asset_downloads(), _worker_pool(workers) as pool:
+            futures = self._submit_pages(pool, site_id, pages, converter)
+            return self._collect_pages(
+                site_id, pages, futures, output_dir, verbose=verbose
+            )
+
     def sync_section(
         self,
         site_id: str,
@@ -279,12 +1098,21 @@ class OneNoteClient:
         output_dir: str | Path,
         *,
         verbose: bool = True,
+        workers: int = 1,
+        converter: ConversionPool | None = None,
     ) -> list[Path]:
         output = Path(output_dir)
         pages = self.list_pages(site_id, section_id=section_id)
         if verbose:
             print(f"{len(pages)} page(s) in section")
-        written = self._sync_pages(site_id, pages, output, verbose=verbose)
+        written = self._sync_pages(
+            site_id,
+            pages,
+            output,
+            verbose=verbose,
+            workers=workers,
+            converter=converter,
+        )
         if verbose:
             print(f"Synced {len(written)} page(s) to {output}")
         return written
@@ -296,66 +1124,177 @@ class OneNoteClient:
         output_dir: str | Path,
         *,
         verbose: bool = True,
+        workers: int = 1,
+        full: bool = False,
+        converter: ConversionPool | None = None,
     ) -> list[Path]:
+        """Sync a notebook, skipping sections unchanged since the last run.
+
+        A manifest under ``_meta_root`` records each section's
+        ``lastModifiedDateTime`` and pages. A section whose timestamp still
+        matches, and whose Markdown files all exist, is not re-listed.
+        ``full`` re-lists every section.
+        """
         output = Path(output_dir)
         written: list[Path] = []
-        notebook = self.graph.get_json(f"/sites/{site_id}/onenote/notebooks/{notebook_id}")
+        notebook = self.get_notebook(site_id, notebook_id)
         notebook_name = _sanitize_filename(notebook.get("displayName", "notebook"))
         if verbose:
             print(f"Notebook: {notebook_name}")
-        for section in self.list_sections(site_id, notebook_id):
-            section_name = _sanitize_filename(section.get("displayName", "section"))
-            if verbose:
-                print(f"Section: {section_name}")
-            pages = self.list_pages(site_id, section_id=section["id"])
-            written.extend(
-                self._sync_pages(
-                    site_id,
-                    pages,
-                    output / notebook_name / section_name,
-                    verbose=verbose,
+        manifest_path = self._notebook_manifest_path(site_id, notebook_id)
+        previous = _read_meta(manifest_path).get("sections", {})
+        sections: dict[str, dict[str, Any]] = {}
+        report = SyncReport()
+        with self._asset_downloads(), _worker_pool(workers) as pool:
+            # Queue each section as soon as it is listed so the pool never
+            # drains between sections.
+            queued = []
+            for groups, section in _iter_tree_sections(notebook):
+                folders = [_sanitize_filename(group) for group in groups]
+                folders.append(_sanitize_filename(section.get("displayName", "section")))
+                section_name = "/".join(folders)
+                section_dir = output.joinpath(notebook_name, *folders)
+                known = previous.pop(section["id"], {})
+                known_pages = known.get("pages", {})
+                if (
+                    not full
+                    and known
+                    and known.get("lastModifiedDateTime") == section.get("lastModifiedDateTime")
+                ):
+                    paths = [
+                        section_dir / _page_filename({"id": page_id, **entry})
+                        for page_id, entry in known_pages.items()
+                    ]
+                    if all(path.exists() for path in paths):
+                        sections[section["id"]] = known
+                        report.skipped_sections += 1
+                        queued.append(
+                            (section_name, section_dir, None, [p.resolve() for p in paths])
+                        )
+                        continue
+                pages = self.list_pages(site_id, section_id=section["id"])
+                report.compare(known_pages, pages)
+                sections[section["id"]] = {
+                    "displayName": section.get("displayName", ""),
+                    "lastModifiedDateTime": section.get("lastModifiedDateTime"),
+                    "pages": {
+                        page["id"]: {
+                            "title": page.get("title", page["id"][:12]),
+                            "lastModifiedDateTime": page.get("lastModifiedDateTime"),
+                        }
+                        for page in pages
+                    },
+                }
+                futures = self._submit_pages(pool, site_id, pages, converter)
+                queued.append((section_name, section_dir, pages, futures))
+            for known in previous.values():
+                report.removed += len(known.get("pages", {}))
+            for section_name, section_dir, pages, results in queued:
+                if pages is None:
+                    if verbose:
+                        print(f"Section: {section_name} (unchanged, {len(results)} page(s))")
+                    written.extend(results)
+                    continue
+                if verbose:
+                    print(f"Section: {section_name}")
+                written.extend(
+                    self._collect_pages(
+                        site_id, pages, results, section_dir, verbose=verbose
+                    )
                 )
-            )
+        _write_meta(
+            manifest_path,
+            {
+                "notebook_id": notebook_id,
+                "displayName": notebook.get("displayName", ""),
+                "synced_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "sections": sections,
+            },
+        )
         if verbose:
+            print(report.summary())
             print(f"Synced {len(written)} page(s) to {output}")
         return written
 
     def sync_site(
-        self, site_id: str, output_dir: str | Path, *, verbose: bool = True
+        self,
+        site_id: str,
+        output_dir: str | Path,
+        *,
+        verbose: bool = True,
+        workers: int = 1,
+        full: bool = False,
+        converter: ConversionPool | None = None,
     ) -> list[Path]:
         output = Path(output_dir)
         written: list[Path] = []
-        for notebook in self.list_notebooks(site_id):
-            written.extend(self.sync_notebook(site_id, notebook["id"], output, verbose=verbose))
+        with self._asset_downloads():
+            for notebook in self.notebook_tree(site_id):
+                written.extend(
+                    self.sync_notebook(
+                        site_id,
+                        notebook["id"],
+                        output,
+                        verbose=verbose,
+                        workers=workers,
+                        full=full,
+                        converter=converter,
+                    )
+                )
         if verbose:
             print(f"Synced {len(written)} page(s) to {output}")
         return written
 
 
 class DriveClient:
-    def __init__(self, env_path: str | Path | None = None):
-        self.graph = GraphClient(env_path, DRIVE_SCOPES)
+    def __init__(
+        self,
+        env_path: str | Path | None = None,
+        *,
+        http_cache: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        materialize: str = "copy",
+    ):
+        if materialize not in MATERIALIZE_MODES:
+            raise ValueError(
+                f"materialize must be one of {', '.join(MATERIALIZE_MODES)}, got {materialize!r}"
+            )
+        self.graph = GraphClient(
+            env_path,
+            DRIVE_SCOPES,
+            max_connections=max_connections,
+            response_cache=ResponseCache() if http_cache else None,
+        )
+        self.materialize = materialize
+        self.meta_index = MetaIndex()
+        self._blob_lock = threading.Lock()
+        self._blob_downloads: dict[Path, Future[tuple[Path, dict[str, str]]]] = {}
+
+    def iter_sites(self, search: str) -> Iterator[dict[str, Any]]:
+        return self.graph.iter_all(f"/sites?search={search}", select=_SITE_FIELDS)
 
     def list_sites(self, search: str) -> list[dict[str, Any]]:
-        return self.graph.get_all(f"/sites?search={search}")
+        return list(self.iter_sites(search))
 
     def _resolve_site_id(self, site_id: str | None, site_search: str | None) -> str | None:
         if site_id:
             return site_id
         if site_search:
-            sites = self.list_sites(site_search)
-            if not sites:
+            site = next(self.iter_sites(site_search), None)
+            if site is None:
                 raise ValueError(f"No sites found for '{site_search}'")
-            return sites[0]["id"]
+            return site["id"]
         return None
 
     def _resolve_drive(self, site_id: str | None = None, site_search: str | None = None) -> dict[str, Any]:
         resolved_site_id = self._resolve_site_id(site_id, site_search)
         if resolved_site_id:
-            drive = self.graph.get_json(f"/sites/{resolved_site_id}/drive")
+            drive = self.graph.get_json(
+                f"/sites/{resolved_site_id}/drive", select=_DRIVE_FIELDS
+            )
             drive["resolved_site_id"] = resolved_site_id
             return drive
-        drive = self.graph.get_json("/me/drive")
+        drive = self.graph.get_json("/me/drive", select=_DRIVE_FIELDS)
         drive["resolved_site_id"] = None
         return drive
 
@@ -369,13 +1308,14 @@ class DriveClient:
             / filename
         )
 
-    def _drive_meta_path(self, drive_id: str, item_id: str) -> Path:
+    def _delta_state_path(self, drive_id: str, folder_id: str) -> Path:
         return (
             CACHE_ROOT
             / "meta"
             / "drive"
             / _slugify(drive_id)
-            / f"{_item_cache_key(item_id)}.json"
+            / "delta"
+            / f"{_item_cache_key(folder_id)}.json"
         )
 
     def _download_item_if_needed(
@@ -388,36 +1328,112 @@ class DriveClient:
     ) -> tuple[Path, bool]:
         item_id = item["id"]
         filename = item.get("name", item_id)
+        remote_hashes = item.get("file", {}).get("hashes") or {}
+        blob_paths = _blob_paths(remote_hashes)
         source_path = self._drive_source_path(drive_id, item_id, filename)
-        meta_path = self._drive_meta_path(drive_id, item_id)
         remote_etag = item.get("eTag") or item.get("cTag") or ""
-        cached_meta = _read_meta(meta_path)
-        cache_hit = (
-            not force
-            and source_path.exists()
-            and cached_meta.get("etag") == remote_etag
+        cached_meta = self.meta_index.get("drive_item", _slugify(drive_id), item_id)
+        known_blob = None if force else next((p for p in blob_paths if p.exists()), None)
+        hashes = remote_hashes
+
+        if known_blob is not None:
+            # Same bytes already cached (this item, a copy elsewhere, or a
+            # reverted version): link the blob instead of downloading.
+            source_path, cache_hit = known_blob, True
+        elif not force and source_path.exists() and cached_meta.get("etag") == remote_etag:
+            # Per-item cache from before the blob store, or an item without hashes.
+            cache_hit = True
+        else:
+            cache_hit = False
+            try:
+                source_path, hashes = self._download_source(
+                    drive_id, item_id, source_path, remote_hashes
+                )
+            except IntegrityError as exc:
+                # The item changed between listing and download, or Graph
+                # served stale hashes: re-read the metadata and try once more.
+                print(f"warning: {exc}; retrying", file=sys.stderr)
+                item = self.graph.get_json(
+                    f"/drives/{drive_id}/items/{item_id}", select=_DRIVE_ITEM_FIELDS
+                )
+                remote_hashes = item.get("file", {}).get("hashes") or {}
+                remote_etag = item.get("eTag") or item.get("cTag") or ""
+                source_path, hashes = self._download_source(
+                    drive_id, item_id, source_path, remote_hashes
+                )
+
+        if not cache_hit or cached_meta.get("etag") != remote_etag:
+            cached_meta = {
+                "item_id": item_id,
+                "name": filename,
+                "etag": remote_etag,
+                "size": item.get("size"),
+                "webUrl": item.get("webUrl"),
+                **hashes,
+                **(
+                    {"blob": source_path.relative_to(CACHE_ROOT).as_posix()}
+                    if source_path.is_relative_to(BLOB_STORE_DIR)
+                    else {}
+                ),
+                "cached_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            }
+            self.meta_index.put("drive_item", _slugify(drive_id), item_id, cached_meta)
+
+        local_path = _materialize(
+            source_path,
+            output_path,
+            self.materialize,
+            sha1_hash=cached_meta.get("sha1Hash"),
         )
+        return local_path, cache_hit
 
-        if not cache_hit:
-            content = self.graph.get_bytes(
-                f"/drives/{drive_id}/items/{item_id}/content", timeout=120
-            )
-            source_path.parent.mkdir(parents=True, exist_ok=True)
-            source_path.write_bytes(content)
-            _write_meta(
-                meta_path,
-                {
-                    "item_id": item_id,
-                    "name": filename,
-                    "etag": remote_etag,
-                    "size": item.get("size"),
-                    "webUrl": item.get("webUrl"),
-                    "cached_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                },
+    def _download_source(
+        self,
+        drive_id: str,
+        item_id: str,
+        source_path: Path,
+        remote_hashes: dict[str, str],
+    ) -> tuple[Path, dict[str, str]]:
+        """Download an item, returning where its bytes landed and their hashes.
+
+        Items with ``file.hashes`` are staged under ``blobs/incoming`` and
+        moved to their hash address only after the bytes verified; the rest
+        keep the per-item ``source_path``.
+        """
+        path = f"/drives/{drive_id}/items/{item_id}/content"
+        blob_paths = _blob_paths(remote_hashes)
+        if not blob_paths:
+            hashes = self.graph.download(path, source_path, timeout=120)
+            return source_path, hashes
+
+        def download() -> tuple[Path, dict[str, str]]:
+            incoming = BLOB_STORE_DIR / "incoming" / f"{os.getpid()}.{threading.get_ident()}"
+            hashes = self.graph.download(
+                path, incoming, timeout=120, expected_hashes=remote_hashes
             )
-
-        local_path = _copy_if_needed(source_path, output_path)
-        return local_path, cache_hit
+            # Only reached once every reported hash matched the bytes.
+            blob = blob_paths[0]
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            incoming.replace(blob)
+            _link_blob(blob, _blob_paths(hashes))
+            return blob, hashes
+
+        # Concurrent workers syncing two copies of one file share a download.
+        key = blob_paths[0]
+        with self._blob_lock:
+            future = self._blob_downloads.get(key)
+            owner = future is None
+            if future is None:
+                future = self._blob_downloads[key] = Future()
+        if owner:
+            try:
+                future.set_result(download())
+            except Exception as exc:  # noqa: BLE001
+                # Forget failures so a retry downloads again.
+                with self._blob_lock:
+                    del self._blob_downloads[key]
+                future.set_exception(exc)
+        return future.result()
 
     def _parse_sharepoint_file_url(self, url: str) -> tuple[str, str]:
         parsed = urlsplit(unquote(url))
@@ -462,17 +1478,23 @@ class DriveClient:
         local_path, _ = self._download_item_if_needed(drive_id, item, output_path)
         return local_path
 
-    def _list_folder_items(
+    def _iter_folder_items(
         self, drive_id: str, remote_path: str
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[dict[str, Any]]:
         encoded = _encode_graph_path(remote_path)
         if encoded:
             path = f"/drives/{drive_id}/root:/{encoded}:/children"
         else:
             path = f"/drives/{drive_id}/root/children"
-        return self.graph.get_all(
-            path,
-            params={"$select": "name,size,id,file,folder,eTag,cTag,webUrl", "$top": "200"},
+        return self.graph.iter_all(
+            path, params={"$top": "200"}, select=_DRIVE_ITEM_FIELDS
+        )
+
+    def _iter_children(self, drive_id: str, item_id: str) -> Iterator[dict[str, Any]]:
+        return self.graph.iter_all(
+            f"/drives/{drive_id}/items/{item_id}/children",
+            params={"$top": "200"},
+            select=_DRIVE_ITEM_FIELDS,
         )
 
     def sync_folder(
@@ -483,33 +1505,271 @@ class DriveClient:
         site_id: str | None = None,
         site_search: str | None = None,
         force: bool = False,
+        recursive: bool = False,
+        workers: int = 1,
     ) -> list[Path]:
+        """Materialize the files of a drive folder under ``output_dir``.
+
+        With ``recursive`` subfolders are mirrored as local directories.
+        Folder listings run on a pool of ``workers`` threads and hand each
+        file to a second pool of ``workers`` download threads as its page
+        arrives, so downloads start before a large folder is fully listed.
+        Results are reported breadth-first in discovery order.
+        """
         drive = self._resolve_drive(site_id=site_id, site_search=site_search)
         drive_id = drive["id"]
         output = Path(output_dir)
         output.mkdir(parents=True, exist_ok=True)
-        items = self._list_folder_items(drive_id, remote_path)
         written: list[Path] = []
 
         print(f"Drive: {drive.get('name', drive_id)}")
         print(f"Remote folder: {remote_path}")
         print(f"Output directory: {output.resolve()}")
 
-        for item in items:
-            if "file" not in item:
-                print(f"skip  {item.get('name', item['id'])} (not a file)")
+        queued: deque[tuple[str, dict[str, Any], Future[tuple[Path, bool]]]] = deque()
+        failed = 0
+
+        def report(*, wait: bool) -> None:
+            nonlocal failed
+            while queued and (wait or queued[0][2].done()):
+                relative, item, future = queued.popleft()
+                try:
+                    local_path, cache_hit = future.result()
+                except IntegrityError as exc:
+                    print(f"fail  {relative} ({exc})")
+                    failed += 1
+                    continue
+                action = "skip" if cache_hit and not force else "sync"
+                size_kb = (item.get("size", 0) or 0) / 1024
+                print(f"{action:<5} {relative} ({size_kb:.1f} KB) -> {local_path}")
+                written.append(local_path)
+
+        def list_folder(prefix: str, items: Iterator[dict[str, Any]]) -> list[tuple]:
+            # Runs on the listing pool: every file is handed to the download
+            # pool and every subfolder to the listing pool as soon as its
+            # page arrives, so transfers overlap the remaining pages.
+            entries: list[tuple] = []
+            for item in items:
+                relative = f"{prefix}{item.get('name', item['id'])}"
+                if "file" in item:
+                    future = downloads.submit(
+                        self._download_item_if_needed,
+                        drive_id,
+                        item,
+                        output / relative,
+                        force=force,
+                    )
+                    entries.append(("file", relative, item, future))
+                elif recursive and "folder" in item:
+                    children = self._iter_children(drive_id, item["id"])
+                    listing = listings.submit(list_folder, f"{relative}/", children)
+                    entries.append(("folder", relative, item, listing))
+                else:
+                    entries.append(("skip", relative, item, None))
+            return entries
+
+        with _worker_pool(workers) as downloads, _worker_pool(workers) as listings:
+            folders = deque(
+                [listings.submit(list_folder, "", self._iter_folder_items(drive_id, remote_path))]
+            )
+            while folders:
+                for kind, relative, item, future in folders.popleft().result():
+                    if kind == "file":
+                        queued.append((relative, item, future))
+                    elif kind == "folder":
+                        folders.append(future)
+                    else:
+                        print(f"skip  {relative} (not a file)")
+                report(wait=False)
+            report(wait=True)
+
+        print(f"Done. {len(written)} file(s) materialized, {failed} failed integrity checks.")
+        return written
+
+    def _fetch_delta(
+        self, drive_id: str, delta_link: str | None
+    ) -> tuple[list[dict[str, Any]], str, bool]:
+        """Returns (changes, new deltaLink, whether this was a full enumeration)."""
+        if delta_link:
+            try:
+                changes, next_link = self.graph.get_delta(delta_link)
+                return changes, next_link, False
+            except GraphApiError as exc:
+                if exc.status_code != 410:
+                    raise
+                print("Delta token expired; re-enumerating the drive")
+        changes, next_link = self.graph.get_delta(
+            f"/drives/{drive_id}/root/delta", select=_DRIVE_DELTA_FIELDS
+        )
+        return changes, next_link, True
+
+    def sync_folder_delta(
+        self,
+        remote_path: str,
+        output_dir: str | Path,
+        *,
+        site_id: str | None = None,
+        site_search: str | None = None,
+        force: bool = False,
+        workers: int = 1,
+    ) -> list[Path]:
+        """Mirror a folder tree, fetching only what changed since the last run.
+
+        SharePoint libraries only support delta on the drive root, and delta
+        items carry no path, so every item is tracked by ID and parent ID in
+        a state file under ``meta/drive`` (one per drive and folder) together
+        with the ``deltaLink``. The first run enumerates the drive; later runs
+        apply only the changes, including deletes, moves and folder renames,
+        to the local mirror. Downloads keep the eTag cache of ``sync_folder``.
+        """
+        drive = self._resolve_drive(site_id=site_id, site_search=site_search)
+        drive_id = drive["id"]
+        encoded = _encode_graph_path(remote_path)
+        folder = self.graph.get_json(
+            f"/drives/{drive_id}/root:/{encoded}" if encoded else f"/drives/{drive_id}/root",
+            select=("id", "name"),
+        )
+        output = Path(output_dir)
+        output.mkdir(parents=True, exist_ok=True)
+        state_path = self._delta_state_path(drive_id, folder["id"])
+        state = _read_meta(state_path)
+        output_key = str(output.resolve())
+
+        print(f"Drive: {drive.get('name', drive_id)}")
+        print(f"Remote folder: {remote_path}")
+        print(f"Output directory: {output_key}")
+
+        changes, delta_link, full = self._fetch_delta(
+            drive_id, None if force else state.get("deltaLink")
+        )
+        entries: dict[str, dict[str, Any]] = {} if full else state.get("items", {})
+        # Files materialized by an earlier run; a full enumeration rebuilds
+        # ``entries`` but must still clean up what it no longer sees.
+        previous = {
+            item_id: entry["local"]
+            for item_id, entry in state.get("items", {}).items()
+            if "local" in entry
+        }
+        changed: set[str] = set()
+        deleted = 0
+        for item in changes:
+            item_id = item["id"]
+            if "deleted" in item:
+                if entries.pop(item_id, None) is not None:
+                    deleted += 1
                 continue
+            entry = {
+                key: item[key]
+                for key in ("name", "eTag", "cTag", "size", "file", "webUrl")
+                if key in item
+            }
+            entry["parent"] = item.get("parentReference", {}).get("id")
+            if "folder" in item or "root" in item or "package" in item:
+                entry["folder"] = True
+            elif item_id in previous:
+                entry["local"] = previous[item_id]
+            entries[item_id] = entry
+            changed.add(item_id)
+        print(f"Delta: {len(changes)} change(s), {deleted} deleted")
+
+        paths: dict[str | None, str | None] = {folder["id"]: "", None: None}
+
+        def relative_path(item_id: str) -> str | None:
+            """Path below the synced folder, or None when outside it."""
+            chain: list[str] = []
+            node: str | None = item_id
+            while node not in paths:
+                if node not in entries:
+                    paths[node] = None
+                    break
+                chain.append(node)
+                node = entries[node].get("parent")
+            base = paths[node]
+            for node in reversed(chain):
+                entry = entries[node]
+                if base is not None:
+                    base = f"{base}{entry['name']}{'/' if entry.get('folder') else ''}"
+                paths[node] = base
+            return base
+
+        remove: list[str] = [
+            local for item_id, local in previous.items() if item_id not in entries
+        ]
+        queued: list[tuple[str, str, dict[str, Any]]] = []
+        rematerialize = full or state.get("output") != output_key
+        for item_id, entry in entries.items():
+            if entry.get("folder") or "file" not in entry:
+                continue
+            relative = relative_path(item_id)
+            local = entry.get("local")
+            if local is not None and local != relative:
+                remove.append(local)
+                del entry["local"]
+            if relative is None:
+                continue
+            if (
+                rematerialize
+                or item_id in changed
+                or local != relative
+                or not (output / relative).exists()
+            ):
+                queued.append((item_id, relative, entry))
+
+        for local in remove:
+            target = output / local
+            target.unlink(missing_ok=True)
+            for parent in target.parents:
+                if parent == output or not parent.is_relative_to(output):
+                    break
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+            print(f"del   {local}")
 
-            output_path = output / item["name"]
-            local_path, cache_hit = self._download_item_if_needed(
-                drive_id, item, output_path, force=force
-            )
-            action = "skip" if cache_hit and not force else "sync"
-            size_kb = (item.get("size", 0) or 0) / 1024
-            print(f"{action:<5} {item['name']} ({size_kb:.1f} KB) -> {local_path}")
-            written.append(local_path)
+        written: list[Path] = []
+        failed = 0
+        with _worker_pool(workers) as pool:
+            futures = [
+                pool.submit(
+                    self._download_item_if_needed,
+                    drive_id,
+                    {"id": item_id, **entry},
+                    output / relative,
+                    force=force,
+                )
+                for item_id, relative, entry in queued
+            ]
+            for (item_id, relative, entry), future in zip(queued, futures):
+                try:
+                    local_path, cache_hit = future.result()
+                except IntegrityError as exc:
+                    # Left without "local", so the next run tries it again.
+                    print(f"fail  {relative} ({exc})")
+                    failed += 1
+                    continue
+                entry["local"] = relative
+                action = "skip" if cache_hit and not force else "sync"
+                size_kb = (entry.get("size", 0) or 0) / 1024
+                print(f"{action:<5} {relative} ({size_kb:.1f} KB) -> {local_path}")
+                written.append(local_path)
 
-        print(f"Done. {len(written)} file(s) materialized.")
+        _write_meta(
+            state_path,
+            {
+                "drive_id": drive_id,
+                "folder_id": folder["id"],
+                "remote_path": remote_path,
+                "output": output_key,
+                "deltaLink": delta_link,
+                "synced_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "items": entries,
+            },
+        )
+        print(
+            f"Done. {len(written)} file(s) materialized, {len(remove)} removed, "
+            f"{failed} failed integrity checks."
+        )
         return written
 
 
@@ -518,8 +1778,13 @@ class WikiPageClient:
 
     _CONTENT_FIELDS = ("PublishingPageContent", "WikiField", "CanvasContent1")
 
-    def __init__(self, env_path: str | Path | None = None):
-        self.graph = GraphClient(env_path, DRIVE_SCOPES)
+    def __init__(self, env_path: str | Path | None = None, *, http_cache: bool = False):
+        self.graph = GraphClient(
+            env_path,
+            DRIVE_SCOPES,
+            response_cache=ResponseCache() if http_cache else None,
+        )
+        self.meta_index = MetaIndex()
 
     def find_pages_drive(self, site_id: str) -> str:
         """Find the Pages library drive ID for a site."""
@@ -595,14 +1860,15 @@ class WikiPageClient:
                     return field_name, content
         return None
 
-    def fetch_page_content(
-        self, drive_id: str, item_id: str
+    def _page_source(
+        self, drive_id: str, item_id: str, item: dict[str, Any] | None
     ) -> tuple[str, str, str]:
-        """Fetch a single wiki page content. Returns (title, markdown, source_field)."""
-        item = self.graph.get_json(
-            f"/drives/{drive_id}/items/{item_id}",
-            params={"$expand": "listItem($expand=fields)"},
-        )
+        """Locate a wiki page's HTML. Returns (title, source_field, html)."""
+        if item is None:
+            item = self.graph.get_json(
+                f"/drives/{drive_id}/items/{item_id}",
+                params={"$expand": "listItem($expand=fields)"},
+            )
         filename = item.get("name", "page.aspx")
         title = filename.replace(".aspx", "").replace("_", " ")
 
@@ -627,11 +1893,14 @@ class WikiPageClient:
             )
 
         field_name, html_content = result
-        md = markdownify(html_content, heading_style="ATX", strip=["script", "style"])
-        md = re.sub(r"\n{4,}", "\n\n\n", md)
-        md = re.sub(r"[ \t]+\n", "\n", md)
-        full_md = f"# {title}\n\n*Source: SharePoint Wiki*\n\n{md.strip()}"
-        return title, full_md, field_name
+        return title, field_name, html_content
+
+    def fetch_page_content(
+        self, drive_id: str, item_id: str, *, item: dict[str, Any] | None = None
+    ) -> tuple[str, str, str]:
+        """Fetch a single wiki page content. Returns (title, markdown, source_field)."""
+        title, field_name, html_content = self._page_source(drive_id, item_id, item)
+        return title, wiki_html_to_markdown(title, html_content), field_name
 
     def search_and_fetch(
         self,
@@ -640,22 +1909,58 @@ class WikiPageClient:
         output_dir: str | Path,
         *,
         max_results: int = 10,
+        converter: ConversionPool | None = None,
     ) -> list[Path]:
         """Search for wiki pages and fetch all matches."""
+        converter = converter or _INLINE_CONVERSION
         drive_id = self.find_pages_drive(site_id)
         pages = self.search_pages(drive_id, query, max_results=max_results)
         out = Path(output_dir)
         out.mkdir(parents=True, exist_ok=True)
         results: list[Path] = []
+        paths = [f"/drives/{drive_id}/items/{page['id']}" for page in pages]
+        items = self.graph.batch(
+            [
+                {"id": str(index), "url": f"{path}?$expand=listItem($expand=fields)"}
+                for index, path in enumerate(paths)
+            ]
+        )
 
-        for page in pages:
+        # Pages are converted while later ones are still being fetched.
+        queued: list[tuple[dict[str, Any], str, Future[str]] | Exception] = []
+        for index, page in enumerate(pages):
+            try:
+                item = batch_response_json(items[str(index)], paths[index])
+                title, field, html_content = self._page_source(drive_id, page["id"], item)
+                queued.append(
+                    (item, field, converter.submit(wiki_html_to_markdown, title, html_content))
+                )
+            except Exception as exc:  # noqa: BLE001
+                queued.append(exc)
+
+        for page, entry in zip(pages, queued):
             safe_name = _sanitize_filename(page["name"])
             target = out / f"{safe_name}.md"
             try:
-                title, md_content, field = self.fetch_page_content(
-                    drive_id, page["id"]
+                if isinstance(entry, Exception):
+                    raise entry
+                item, field, markdown = entry
+                md_content = markdown.result()
+                _write_atomic(target, md_content.encode("utf-8"))
+                self.meta_index.put(
+                    "wiki_page",
+                    _slugify(drive_id),
+                    page["id"],
+                    {
+                        "item_id": page["id"],
+                        "name": page["name"],
+                        "etag": item.get("eTag", ""),
+                        "source_field": field,
+                        "webUrl": page.get("webUrl"),
+                        "path": str(target.resolve()),
+                        "cached_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    },
                 )
-                target.write_text(md_content, encoding="utf-8")
                 print(f"✅ {safe_name} ({len(md_content)} chars, via {field})")
                 results.append(target)
             except Exception as exc:  # noqa: BLE001
@@ -664,6 +1969,222 @@ class WikiPageClient:
         return results
 
 
+def wiki_html_to_markdown(title: str, html_content: str) -> str:
+    from markdownify import markdownify
+
+    md = markdownify(html_content, heading_style="ATX", strip=["script", "style"])
+    md = re.sub(r"\n{4,}", "\n\n\n", md)
+    md = re.sub(r"[ \t]+\n", "\n", md)
+    return f"# {title}\n\n*Source: SharePoint Wiki*\n\n{md.strip()}"
+
+
+@dataclass
+class _CacheEntry:
+    """Cache files evicted together, and the index records pointing at them."""
+
+    paths: list[Path]
+    accessed_at: float
+    size: int = 0
+    records: list[tuple[str, str, str]] = field(default_factory=list)
+
+
+class CacheJanitor:
+    """Size- and age-bounded eviction for ``CACHE_ROOT``.
+
+    An entry is a content file plus the index records that point at it: a
+    Drive blob (with its hash aliases and any hard links under the cache) and
+    every ``drive_item`` using it; a OneNote page's HTML and Markdown and its
+    record; an asset and its ``onenote_resource`` records. Recency is the
+    index's ``accessed_at``, and a blob or asset is as recent as the newest
+    record or page referring to it. Files the index does not know about
+    (HTTP cache, ``materialized/``, leftovers) use their own atime / mtime.
+    ``meta/`` and ``auth/`` are never evicted.
+    """
+
+    _KEEP = ("meta", "auth")
+    # Dot-files this young may be a download or write still in progress.
+    _TEMP_GRACE = 3600.0
+
+    def __init__(self, index: MetaIndex | None = None):
+        self.index = index or MetaIndex()
+
+    def _top_dirs(self) -> list[Path]:
+        if not CACHE_ROOT.is_dir():
+            return []
+        return sorted(path for path in CACHE_ROOT.iterdir() if path.is_dir())
+
+    def usage(self) -> list[tuple[str, int, int]]:
+        """``(top-level directory, files, bytes)`` for everything under the root."""
+        rows = []
+        for top in self._top_dirs():
+            files = size = 0
+            for dirpath, _, filenames in os.walk(top):
+                for name in filenames:
+                    try:
+                        size += os.lstat(os.path.join(dirpath, name)).st_size
+                    except FileNotFoundError:
+                        continue
+                    files += 1
+            rows.append((top.name, files, size))
+        return rows
+
+    def entries(self) -> tuple[list[_CacheEntry], list[tuple[str, str, str]]]:
+        """Evictable entries, plus index records whose files are already gone."""
+        entries: list[_CacheEntry] = []
+        owners: dict[tuple[int, int], _CacheEntry] = {}
+        stale: list[tuple[str, str, str]] = []
+
+        def claim(
+            paths: list[Path], accessed_at: float, record: tuple[str, str, str] | None = None
+        ) -> None:
+            present = []
+            for path in paths:
+                try:
+                    present.append((path, path.lstat()))
+                except FileNotFoundError:
+                    continue
+            if not present:
+                if record is not None:
+                    stale.append(record)
+                return
+            identities = [(st.st_dev, st.st_ino) for _, st in present]
+            entry = next((owners[i] for i in identities if i in owners), None)
+            if entry is None:
+                entry = _CacheEntry([], accessed_at)
+                entries.append(entry)
+            entry.accessed_at = max(entry.accessed_at, accessed_at)
+            for (path, st), identity in zip(present, identities):
+                if path not in entry.paths:
+                    entry.paths.append(path)
+                if identity not in owners:
+                    owners[identity] = entry
+                    entry.size += st.st_size
+            if record is not None:
+                entry.records.append(record)
+
+        for kind, scope, key, data, accessed_at in self.index.records():
+            record = (kind, scope, key)
+            accessed_at = accessed_at or 0.0
+            if kind == "drive_item":
+                if data.get("blob"):
+                    blob = CACHE_ROOT / data["blob"]
+                    claim([blob, *(p for p in _blob_paths(data) if p != blob)], accessed_at, record)
+                else:
+                    source = CACHE_ROOT / "sources" / "drive" / scope / _item_cache_key(key)
+                    claim([source / data.get("name", key)], accessed_at, record)
+            elif kind == "onenote_page":
+                claim(
+                    [
+                        CACHE_ROOT / "sources" / "onenote" / scope / "pages" / f"{key}.html",
+                        CACHE_ROOT / "derived" / "onenote" / scope / "pages" / f"{key}.md",
+                    ],
+                    accessed_at,
+                    record,
+                )
+                # A page in use keeps its images and attachments warm.
+                for path in (data.get("assets") or {}).values():
+                    claim([Path(path)], accessed_at)
+            elif kind == "onenote_resource":
+                claim([_asset_path(data["sha1Hash"], data.get("suffix", ""))], accessed_at, record)
+            # wiki_page records point into the caller's output directory: nothing to evict.
+
+        now = time.time()
+        for top in self._top_dirs():
+            if top.name in self._KEEP:
+                continue
+            for dirpath, _, filenames in os.walk(top):
+                for name in filenames:
+                    path = Path(dirpath) / name
+                    try:
+                        st = path.lstat()
+                    except FileNotFoundError:
+                        continue
+                    identity = (st.st_dev, st.st_ino)
+                    if identity in owners:
+                        # e.g. a hard-linked copy in materialized/: goes with its blob.
+                        if path not in owners[identity].paths:
+                            owners[identity].paths.append(path)
+                        continue
+                    if name.startswith(".") and now - st.st_mtime < self._TEMP_GRACE:
+                        continue
+                    entry = _CacheEntry([path], max(st.st_atime, st.st_mtime), st.st_size)
+                    owners[identity] = entry
+                    entries.append(entry)
+        return entries, stale
+
+    def gc(self, max_size: int, *, dry_run: bool = False) -> tuple[list[_CacheEntry], int]:
+        """Evict least recently used entries until the rest fits in ``max_size`` bytes.
+
+        Returns the evicted entries and the number of index records removed.
+        """
+        entries, stale = self.entries()
+        total = sum(entry.size for entry in entries)
+        victims = []
+        for entry in sorted(entries, key=lambda e: e.accessed_at):
+            if total <= max_size:
+                break
+            victims.append(entry)
+            total -= entry.size
+        return victims, self._evict(victims, stale, dry_run=dry_run)
+
+    def prune(self, older_than: float, *, dry_run: bool = False) -> tuple[list[_CacheEntry], int]:
+        """Evict entries not accessed in the last ``older_than`` seconds."""
+        entries, stale = self.entries()
+        cutoff = time.time() - older_than
+        victims = [entry for entry in entries if entry.accessed_at < cutoff]
+        return victims, self._evict(victims, stale, dry_run=dry_run)
+
+    def _evict(
+        self, victims: list[_CacheEntry], stale: list[tuple[str, str, str]], *, dry_run: bool
+    ) -> int:
+        records = [*stale, *(record for entry in victims for record in entry.records)]
+        if dry_run:
+            return len(records)
+        # Records go first: an interrupted run leaves unreferenced files,
+        # which the next run collects, never records pointing at nothing.
+        self.index.delete(records)
+        for entry in victims:
+            for path in entry.paths:
+                path.unlink(missing_ok=True)
+                self._remove_empty_parents(path)
+        return len(records)
+
+    def _remove_empty_parents(self, path: Path) -> None:
+        parent = path.parent
+        while parent != CACHE_ROOT and parent.parent != CACHE_ROOT:
+            try:
+                parent.rmdir()
+            except OSError:
+                return
+            parent = parent.parent
+
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+_AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+def _parse_size(text: str) -> int:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*", text, re.IGNORECASE)
+    if match is None:
+        raise argparse.ArgumentTypeError(f"invalid size {text!r} (e.g. 500M, 20G)")
+    return int(float(match[1]) * _SIZE_UNITS[match[2].upper()])
+
+
+def _parse_age(text: str) -> float:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*", text, re.IGNORECASE)
+    if match is None:
+        raise argparse.ArgumentTypeError(f"invalid age {text!r} (e.g. 12h, 30d, 2w)")
+    return float(match[1]) * _AGE_UNITS[match[2].lower()]
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
 def _require_site_identifier(site_id: str | None, site_search: str | None) -> str:
     if not site_id and not site_search:
         raise ValueError("Provide either --site-id or --site-search")
@@ -679,6 +2200,30 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Path to .env file (default: skill dir .env)",
     )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        metavar="FILE",
+        help="Append one JSON line per Graph request to FILE",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print Graph latency, throughput and cache-hit stats to stderr at exit",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        metavar="RPS",
+        help="Graph requests per second for this process "
+        "(default: $MICROSOFT_GRAPH_RATE_LIMIT or 10; 0 disables pacing)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Revalidate metadata GETs with ETag / Last-Modified against the on-disk cache",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     fetch_file = subparsers.add_parser("fetch-file", help="Fetch a SharePoint file")
@@ -698,6 +2243,15 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Convert binary files (docx/pptx/xlsx/pdf) to Markdown",
     )
+    fetch_file.add_argument(
+        "--materialize",
+        choices=MATERIALIZE_MODES,
+        default="copy",
+        help=(
+            "How cached files appear in the output directory (default: copy). "
+            "hardlink/symlink share the cache file, so do not edit the output"
+        ),
+    )
     fetch_file.set_defaults(handler=_handle_fetch_file)
 
     sync_folder = subparsers.add_parser("sync-folder", help="Sync a drive folder")
@@ -706,6 +2260,31 @@ def _build_parser() -> argparse.ArgumentParser:
     sync_folder.add_argument("--site-id", default=None)
     sync_folder.add_argument("--site-search", default=None)
     sync_folder.add_argument("--force", action="store_true")
+    sync_folder.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Also sync subfolders, mirroring the folder tree locally",
+    )
+    sync_folder.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Files downloaded (and folders listed) concurrently (default: 1)",
+    )
+    sync_folder.add_argument(
+        "--materialize",
+        choices=MATERIALIZE_MODES,
+        default="copy",
+        help=(
+            "How cached files appear in the output directory (default: copy). "
+            "hardlink/symlink share the cache file, so do not edit the output"
+        ),
+    )
+    sync_folder.add_argument(
+        "--delta",
+        action="store_true",
+        help="Mirror the folder tree incrementally via the drive delta query (implies --recursive)",
+    )
     sync_folder.add_argument(
         "--convert",
         action="store_true",
@@ -737,6 +2316,11 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     fetch_page.add_argument("--site-id", required=True)
     fetch_page.add_argument("--page-id", required=True)
+    fetch_page.add_argument(
+        "--no-assets",
+        action="store_true",
+        help="Keep image and attachment links remote instead of downloading them",
+    )
     fetch_page.set_defaults(handler=_handle_fetch_onenote_page)
 
     search_pages = subparsers.add_parser(
@@ -766,6 +2350,12 @@ def _build_parser() -> argparse.ArgumentParser:
         "--output-dir", required=True, help="Output directory for markdown files"
     )
     fetch_wiki_page.add_argument("--max-results", type=int, default=10)
+    fetch_wiki_page.add_argument(
+        "--convert-processes",
+        type=int,
+        default=0,
+        help="Convert HTML to Markdown in N worker processes (default: 0, inline)",
+    )
     fetch_wiki_page.set_defaults(handler=_handle_fetch_page)
 
     fetch_onenote = subparsers.add_parser(
@@ -777,13 +2367,58 @@ def _build_parser() -> argparse.ArgumentParser:
     fetch_onenote.add_argument("--output-dir", required=True)
     fetch_onenote.add_argument("--notebook-id", default=None)
     fetch_onenote.add_argument("--section-id", default=None)
+    fetch_onenote.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Pages downloaded and converted concurrently (default: 1)",
+    )
+    fetch_onenote.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-list every section instead of skipping ones unchanged since the last sync",
+    )
+    fetch_onenote.add_argument(
+        "--no-assets",
+        action="store_true",
+        help="Keep image and attachment links remote instead of downloading them",
+    )
+    fetch_onenote.add_argument(
+        "--convert-processes",
+        type=int,
+        default=0,
+        help="Convert HTML to Markdown in N worker processes (default: 0, inline)",
+    )
     fetch_onenote.set_defaults(handler=_handle_fetch_onenote)
 
+    cache = subparsers.add_parser("cache", help=f"Inspect and trim the local cache ({CACHE_ROOT})")
+    cache_commands = cache.add_subparsers(dest="cache_command", required=True)
+    cache_stats = cache_commands.add_parser("stats", help="Show disk usage and index counts")
+    cache_stats.set_defaults(handler=_handle_cache_stats)
+    cache_gc = cache_commands.add_parser(
+        "gc", help="Evict least recently used entries until the cache fits --max-size"
+    )
+    cache_gc.add_argument(
+        "--max-size", type=_parse_size, required=True, help="Size budget, e.g. 500M or 20G"
+    )
+    cache_gc.add_argument("--dry-run", action="store_true", help="Only report what would be evicted")
+    cache_gc.set_defaults(handler=_handle_cache_gc)
+    cache_prune = cache_commands.add_parser(
+        "prune", help="Evict entries not accessed within --older-than"
+    )
+    cache_prune.add_argument(
+        "--older-than", type=_parse_age, required=True, help="Age, e.g. 12h, 30d or 2w"
+    )
+    cache_prune.add_argument("--dry-run", action="store_true", help="Only report what would be evicted")
+    cache_prune.set_defaults(handler=_handle_cache_prune)
+
     return parser
 
 
 def _handle_fetch_file(args: argparse.Namespace) -> int:
-    client = DriveClient(env_path=args.env)
+    client = DriveClient(
+        env_path=args.env, http_cache=args.http_cache, materialize=args.materialize
+    )
     if args.drive_id and args.item_id:
         local_path = client.fetch_by_ids(args.drive_id, args.item_id, args.output_dir)
     elif args.url:
@@ -799,14 +2434,31 @@ def _handle_fetch_file(args: argparse.Namespace) -> int:
 
 
 def _handle_sync_folder(args: argparse.Namespace) -> int:
-    client = DriveClient(env_path=args.env)
-    written = client.sync_folder(
-        args.remote_path,
-        args.output_dir,
-        site_id=args.site_id,
-        site_search=args.site_search,
-        force=args.force,
+    client = DriveClient(
+        env_path=args.env,
+        http_cache=args.http_cache,
+        max_connections=max(args.workers, DEFAULT_MAX_CONNECTIONS),
+        materialize=args.materialize,
     )
+    if args.delta:
+        written = client.sync_folder_delta(
+            args.remote_path,
+            args.output_dir,
+            site_id=args.site_id,
+            site_search=args.site_search,
+            force=args.force,
+            workers=args.workers,
+        )
+    else:
+        written = client.sync_folder(
+            args.remote_path,
+            args.output_dir,
+            site_id=args.site_id,
+            site_search=args.site_search,
+            force=args.force,
+            recursive=args.recursive,
+            workers=args.workers,
+        )
     if args.convert:
         for path in written:
             md_path = _convert_to_markdown(path)
@@ -816,15 +2468,14 @@ def _handle_sync_folder(args: argparse.Namespace) -> int:
 
 
 def _handle_list_sites(args: argparse.Namespace) -> int:
-    client = OneNoteClient(env_path=args.env)
-    sites = client.list_sites(args.search)
-    for site in sites:
+    client = OneNoteClient(env_path=args.env, http_cache=args.http_cache)
+    for site in client.iter_sites(args.search):
         print(f"{site.get('displayName', '?'):<30} {site['id']}")
     return 0
 
 
 def _handle_list_notebooks(args: argparse.Namespace) -> int:
-    client = OneNoteClient(env_path=args.env)
+    client = OneNoteClient(env_path=args.env, http_cache=args.http_cache)
     notebooks = client.list_notebooks(args.site_id)
     for notebook in notebooks:
         print(f"{notebook.get('displayName', '?'):<30} {notebook['id']}")
@@ -832,23 +2483,23 @@ def _handle_list_notebooks(args: argparse.Namespace) -> int:
 
 
 def _handle_list_sections(args: argparse.Namespace) -> int:
-    client = OneNoteClient(env_path=args.env)
-    sections = client.list_sections(args.site_id, args.notebook_id)
-    for section in sections:
-        print(f"{section.get('displayName', '?'):<30} {section['id']}")
+    client = OneNoteClient(env_path=args.env, http_cache=args.http_cache)
+    notebook = client.get_notebook(args.site_id, args.notebook_id)
+    for groups, section in _iter_tree_sections(notebook):
+        name = "/".join((*groups, section.get("displayName", "?")))
+        print(f"{name:<30} {section['id']}")
     return 0
 
 
 def _handle_list_pages(args: argparse.Namespace) -> int:
-    client = OneNoteClient(env_path=args.env)
-    pages = client.list_pages(args.site_id, section_id=args.section_id)
-    for page in pages:
+    client = OneNoteClient(env_path=args.env, http_cache=args.http_cache)
+    for page in client.iter_pages(args.site_id, section_id=args.section_id):
         print(f"{page.get('title', '?'):<40} {page['id']}")
     return 0
 
 
 def _handle_search_pages(args: argparse.Namespace) -> int:
-    client = WikiPageClient(env_path=args.env)
+    client = WikiPageClient(env_path=args.env, http_cache=args.http_cache)
     drive_id = client.find_pages_drive(args.site_id)
     print(f"Pages drive: {drive_id}")
     pages = client.search_pages(drive_id, args.query, max_results=args.max_results)
@@ -860,14 +2511,16 @@ def _handle_search_pages(args: argparse.Namespace) -> int:
 
 
 def _handle_fetch_page(args: argparse.Namespace) -> int:
-    client = WikiPageClient(env_path=args.env)
+    client = WikiPageClient(env_path=args.env, http_cache=args.http_cache)
     if args.site_id and args.query:
-        paths = client.search_and_fetch(
-            args.site_id,
-            args.query,
-            args.output_dir,
-            max_results=args.max_results,
-        )
+        with ConversionPool(args.convert_processes) as converter:
+            paths = client.search_and_fetch(
+                args.site_id,
+                args.query,
+                args.output_dir,
+                max_results=args.max_results,
+                converter=converter,
+            )
         print(f"\n{len(paths)} page(s) fetched.")
     elif args.drive_id and args.item_id:
         title, md_content, field = client.fetch_page_content(args.drive_id, args.item_id)
@@ -883,7 +2536,11 @@ def _handle_fetch_page(args: argparse.Namespace) -> int:
 
 
 def _handle_fetch_onenote_page(args: argparse.Namespace) -> int:
-    client = OneNoteClient(env_path=args.env)
+    client = OneNoteClient(
+        env_path=args.env,
+        http_cache=args.http_cache,
+        fetch_assets=not args.no_assets,
+    )
     markdown = client.fetch_page_markdown(args.site_id, args.page_id)
     print(markdown)
     return 0
@@ -891,22 +2548,94 @@ def _handle_fetch_onenote_page(args: argparse.Namespace) -> int:
 
 def _handle_fetch_onenote(args: argparse.Namespace) -> int:
     _require_site_identifier(args.site_id, args.site_search)
-    client = OneNoteClient(env_path=args.env)
+    client = OneNoteClient(
+        env_path=args.env,
+        http_cache=args.http_cache,
+        # Page workers plus the shared resource-download pool.
+        max_connections=max(args.workers + _ASSET_WORKERS, DEFAULT_MAX_CONNECTIONS),
+        fetch_assets=not args.no_assets,
+    )
     site_id = args.site_id
     if args.site_search:
-        sites = client.list_sites(args.site_search)
-        if not sites:
+        site = next(client.iter_sites(args.site_search), None)
+        if site is None:
             raise ValueError(f"No sites found for '{args.site_search}'")
-        site_id = sites[0]["id"]
-        print(f"Using site: {sites[0].get('displayName', site_id)} ({site_id})")
+        site_id = site["id"]
+        print(f"Using site: {site.get('displayName', site_id)} ({site_id})")
     if site_id is None:
         raise ValueError("Provide either --site-id or --site-search")
-    if args.section_id:
-        client.sync_section(site_id, args.section_id, args.output_dir)
-    elif args.notebook_id:
-        client.sync_notebook(site_id, args.notebook_id, args.output_dir)
-    else:
-        client.sync_site(site_id, args.output_dir)
+    with ConversionPool(args.convert_processes) as converter:
+        if args.section_id:
+            client.sync_section(
+                site_id,
+                args.section_id,
+                args.output_dir,
+                workers=args.workers,
+                converter=converter,
+            )
+        elif args.notebook_id:
+            client.sync_notebook(
+                site_id,
+                args.notebook_id,
+                args.output_dir,
+                workers=args.workers,
+                full=args.full,
+                converter=converter,
+            )
+        else:
+            client.sync_site(
+                site_id,
+                args.output_dir,
+                workers=args.workers,
+                full=args.full,
+                converter=converter,
+            )
+    return 0
+
+
+def _handle_cache_stats(args: argparse.Namespace) -> int:
+    janitor = CacheJanitor()
+    print(f"Cache root: {CACHE_ROOT}")
+    usage = janitor.usage()
+    for name, files, size in usage:
+        print(f"  {name + '/':<14} {files:>8} file(s) {_format_size(size):>10}")
+    total_files = sum(files for _, files, _ in usage)
+    total_size = sum(size for _, _, size in usage)
+    print(f"  {'total':<14} {total_files:>8} file(s) {_format_size(total_size):>10}")
+    counts = janitor.index.counts()
+    print("Index: " + (", ".join(f"{count} {kind}" for kind, count in counts.items()) or "empty"))
+    entries, stale = janitor.entries()
+    if entries:
+        oldest = min(entry.accessed_at for entry in entries)
+        print(
+            f"Evictable: {len(entries)} entries, "
+            f"{_format_size(sum(entry.size for entry in entries))}; least recently used "
+            f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(oldest))}"
+        )
+    if stale:
+        print(f"Stale index records (files already gone): {len(stale)}")
+    return 0
+
+
+def _report_eviction(victims: list[_CacheEntry], records: int, dry_run: bool) -> None:
+    for entry in victims:
+        print(f"evict {entry.paths[0].relative_to(CACHE_ROOT)} ({_format_size(entry.size)})")
+    freed = _format_size(sum(entry.size for entry in victims))
+    print(
+        f"{'Would free' if dry_run else 'Freed'} {freed} from {len(victims)} entries; "
+        f"{records} index record(s) {'to remove' if dry_run else 'removed'}."
+    )
+
+
+def _handle_cache_gc(args: argparse.Namespace) -> int:
+    victims, records = CacheJanitor().gc(args.max_size, dry_run=args.dry_run)
+    _report_eviction(victims, records, args.dry_run)
+    return 0
+
+
+def _handle_cache_prune(args: argparse.Namespace) -> int:
+    victims, records = CacheJanitor().prune(args.older_than, dry_run=args.dry_run)
+    _report_eviction(victims, records, args.dry_run)
     return 0
 
 
@@ -917,14 +2646,17 @@ def main() -> int:
     if handler is None:
         parser.print_help()
         return 1
-    try:
-        return handler(args)
-    except (AuthError, GraphApiError) as exc:
-        print(str(exc), file=sys.stderr)
-        return 1
-    except ValueError as exc:
-        print(f"error: {exc}", file=sys.stderr)
-        return 1
+    if args.rate_limit is not None:
+        GRAPH_RATE_LIMITER.configure(args.rate_limit)
+    with request_tracing(args.trace, print_stats=args.stats):
+        try:
+            return handler(args)
+        except (AuthError, GraphApiError) as exc:
+            print(str(exc), file=sys.stderr)
+            return 1
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
 
 
 if __name__ == "__main__":
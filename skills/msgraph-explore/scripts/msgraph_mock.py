@@ -0,0 +1,1064 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""
+Local stand-in for the Microsoft Graph endpoints used by msgraph-explore.
+
+Serves a deterministic synthetic corpus (sites, OneNote notebooks / sections /
+pages, drive folders and files, search) with configurable pagination, latency
+and 429 injection, so sync throughput can be measured without a tenant or
+network. Point the other scripts at it with::
+
+    MICROSOFT_GRAPH_BASE=http://127.0.0.1:8765/v1.0 MICROSOFT_ACCESS_TOKEN=mock \\
+        uv run skills/msgraph-explore/scripts/msgraph_fetch.py list-sites mock
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlsplit
+from uuid import UUID
+
+API_PREFIX = "/v1.0"
+MOCK_HOST = "mock.sharepoint.com"
+MODIFIED = "2024-06-07T08:09:10Z"
+CREATED = "2024-01-02T03:04:05Z"
+_WORDS = (
+    "design", "review", "budget", "roadmap", "meeting", "notes", "spec",
+    "report", "release", "incident", "planning", "retro", "设计", "会议",
+)
+_FILE_EXTS = (".txt", ".md", ".csv")
+
+
+@dataclass
+class MockConfig:
+    sites: int = 2
+    notebooks: int = 2
+    sections: int = 3
+    pages: int = 20
+    folders: int = 2
+    depth: int = 1
+    shared_files: int = 0
+    files: int = 20
+    page_kb: int = 8
+    file_kb: int = 64
+    images: int = 2
+    section_groups: int = 0
+    resource_kb: int = 16
+    page_size: int = 100
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float = 1.0
+    seed: int = 0
+
+
+class MockGraphError(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        self.status = status
+        self.code = code
+        super().__init__(message)
+
+
+@dataclass
+class MockResponse:
+    status: int
+    body: bytes = b""
+    content_type: str = "application/json"
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _json_response(payload: Any, status: int = 200) -> MockResponse:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return MockResponse(status, body)
+
+
+def _error_response(status: int, code: str, message: str) -> MockResponse:
+    return _json_response({"error": {"code": code, "message": message}}, status)
+
+
+class MockCorpus:
+    """Deterministic synthetic tenant; IDs depend only on the seed and position."""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.sites: list[dict[str, Any]] = []
+        self.notebooks: dict[str, list[dict[str, Any]]] = {}
+        self.sections: dict[str, list[dict[str, Any]]] = {}
+        self.pages: dict[str, list[dict[str, Any]]] = {}
+        self.page_index: dict[str, dict[str, Any]] = {}
+        # sections / section_groups are keyed by their notebook or group ID.
+        self.section_groups: dict[str, list[dict[str, Any]]] = {}
+        self.site_sections: dict[str, list[dict[str, Any]]] = {}
+        # resource ID -> content key; pages share a section logo.
+        self.resources: dict[str, str] = {}
+        self.page_resources: dict[str, list[tuple[str, str]]] = {}
+        self.drives: dict[str, dict[str, Any]] = {}
+        self.site_drives: dict[str, str] = {}
+        self.items: dict[str, dict[str, Any]] = {}
+        self.children: dict[str, list[dict[str, Any]]] = {}
+        self.root_ids: dict[str, str] = {}
+        self.paths: dict[tuple[str, str], str] = {}
+        # Drive change log for /root/delta: last change sequence per item.
+        self.change_seq = 0
+        self.delta_floor = 0
+        self.item_seq: dict[str, int] = {}
+        self.versions: dict[str, int] = {}
+        # Files whose bytes are shared with copies in other folders / sites.
+        self.content_keys: dict[str, str] = {}
+        self.tombstones: dict[str, dict[str, Any]] = {}
+        self._build()
+
+    def _id(self, *parts: object) -> str:
+        key = ":".join(str(part) for part in (self.config.seed, *parts))
+        return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+    def _build(self) -> None:
+        for site_index in range(self.config.sites):
+            site_guid = UUID(self._id("site", site_index))
+            web_guid = UUID(self._id("web", site_index))
+            site_id = f"{MOCK_HOST},{site_guid},{web_guid}"
+            site = {
+                "id": site_id,
+                "name": f"mock-site-{site_index}",
+                "displayName": f"Mock Site {site_index}",
+                "webUrl": f"https://{MOCK_HOST}/sites/mock-site-{site_index}",
+                "description": "Synthetic site served by msgraph_mock.py",
+                "createdDateTime": CREATED,
+                "lastModifiedDateTime": MODIFIED,
+            }
+            self.sites.append(site)
+            self._build_onenote(site_index, site_id)
+            self._build_drive(site_index, site_id, site["webUrl"])
+
+    def _build_onenote(self, site_index: int, site_id: str) -> None:
+        base = f"https://graph.microsoft.com/v1.0/sites/{site_id}/onenote"
+        self.notebooks[site_id] = []
+        for nb_index in range(self.config.notebooks):
+            notebook_id = f"1-{self._id('notebook', site_index, nb_index)}"
+            notebook = {
+                "id": notebook_id,
+                "displayName": f"Notebook {nb_index}",
+                "createdDateTime": CREATED,
+                "lastModifiedDateTime": MODIFIED,
+                "isDefault": nb_index == 0,
+                "self": f"{base}/notebooks/{notebook_id}",
+                "sectionsUrl": f"{base}/notebooks/{notebook_id}/sections",
+                "sectionGroupsUrl": f"{base}/notebooks/{notebook_id}/sectionGroups",
+            }
+            self.notebooks[site_id].append(notebook)
+            parent = {"parentNotebook": {"id": notebook_id, "displayName": notebook["displayName"]}}
+            self._build_container(base, site_id, site_index, notebook_id, (nb_index,), parent)
+            self.section_groups[notebook_id] = []
+            for group_index in range(self.config.section_groups):
+                self._build_group(base, site_id, site_index, notebook_id, (nb_index, f"g{group_index}"), parent)
+
+    def _build_group(
+        self,
+        base: str,
+        site_id: str,
+        site_index: int,
+        parent_id: str,
+        key: tuple[object, ...],
+        parent: dict[str, Any],
+    ) -> None:
+        """Add a section group under ``parent_id``; top-level groups nest one more."""
+        group_id = f"1-{self._id('group', site_index, *key)}"
+        group = {
+            "id": group_id,
+            "displayName": f"Group {'.'.join(str(part) for part in key[1:])}",
+            "createdDateTime": CREATED,
+            "lastModifiedDateTime": MODIFIED,
+            "self": f"{base}/sectionGroups/{group_id}",
+            "sectionsUrl": f"{base}/sectionGroups/{group_id}/sections",
+            "sectionGroupsUrl": f"{base}/sectionGroups/{group_id}/sectionGroups",
+            **parent,
+        }
+        self.section_groups[parent_id].append(group)
+        self.section_groups[group_id] = []
+        child = {
+            "parentNotebook": parent["parentNotebook"],
+            "parentSectionGroup": {"id": group_id, "displayName": group["displayName"]},
+        }
+        self._build_container(base, site_id, site_index, group_id, key, child)
+        if len(key) == 2:
+            self._build_group(base, site_id, site_index, group_id, (*key, "g0"), child)
+
+    def _build_container(
+        self,
+        base: str,
+        site_id: str,
+        site_index: int,
+        container_id: str,
+        key: tuple[object, ...],
+        parent: dict[str, Any],
+    ) -> None:
+        self.sections[container_id] = []
+        for sec_index in range(self.config.sections):
+            section_key = (*key, sec_index)
+            label = ".".join(str(part) for part in section_key)
+            section_id = f"1-{self._id('section', site_index, *section_key)}"
+            section = {
+                "id": section_id,
+                "displayName": f"Section {sec_index}",
+                "createdDateTime": CREATED,
+                "lastModifiedDateTime": MODIFIED,
+                "self": f"{base}/sections/{section_id}",
+                "pagesUrl": f"{base}/sections/{section_id}/pages",
+                **parent,
+            }
+            self.sections[container_id].append(section)
+            self.site_sections.setdefault(site_id, []).append(section)
+            self.pages[section_id] = []
+            logo_id = f"1-{self._id('logo', site_index, *section_key)}"
+            self.resources[logo_id] = "logo"
+            for page_index in range(self.config.pages):
+                page_hex = self._id("page", site_index, *section_key, page_index)
+                page_id = f"1-{page_hex}!{page_index}-{page_hex[:8]}"
+                word = _WORDS[page_index % len(_WORDS)]
+                page = {
+                    "id": page_id,
+                    "title": f"{word.title()} {label}.{page_index}",
+                    "createdDateTime": CREATED,
+                    "lastModifiedDateTime": MODIFIED,
+                    "level": 0,
+                    "order": page_index,
+                    "self": f"{base}/pages/{page_id}",
+                    "contentUrl": f"{base}/pages/{page_id}/content",
+                    "links": {
+                        "oneNoteWebUrl": {
+                            "href": f"https://{MOCK_HOST}/_layouts/OneNote.aspx?id={page_hex}"
+                        }
+                    },
+                    "parentSection": {
+                        "id": section_id,
+                        "displayName": section["displayName"],
+                    },
+                }
+                self.pages[section_id].append(page)
+                self.page_index[page_id] = page
+                embedded = [(logo_id, "image")] if self.config.images else []
+                for image_index in range(1, self.config.images):
+                    resource_id = f"1-{self._id('image', page_hex, image_index)}"
+                    self.resources[resource_id] = resource_id
+                    embedded.append((resource_id, "image"))
+                if page_index % 5 == 0:
+                    resource_id = f"1-{self._id('attachment', page_hex)}"
+                    self.resources[resource_id] = resource_id
+                    embedded.append((resource_id, "attachment"))
+                self.page_resources[page_id] = embedded
+
+    def _build_drive(self, site_index: int, site_id: str, web_url: str) -> None:
+        drive_id = f"b!{self._id('drive', site_index)}"
+        self.drives[drive_id] = {
+            "id": drive_id,
+            "name": "Documents",
+            "driveType": "documentLibrary",
+            "webUrl": f"{web_url}/Shared Documents",
+        }
+        self.site_drives[site_id] = drive_id
+        root_id = self._add_item(drive_id, site_id, None, "root", "", is_folder=True)
+        self.root_ids[drive_id] = root_id
+        self._add_files(drive_id, site_id, root_id, "")
+        self._add_folders(drive_id, site_id, root_id, "", 1)
+
+    def _add_folders(
+        self, drive_id: str, site_id: str, parent_id: str, parent_path: str, level: int
+    ) -> None:
+        for folder_index in range(self.config.folders):
+            name = f"folder-{folder_index:02d}"
+            path = f"{parent_path}/{name}" if parent_path else name
+            folder_id = self._add_item(drive_id, site_id, parent_id, name, path, is_folder=True)
+            self._add_files(drive_id, site_id, folder_id, path)
+            if level < self.config.depth:
+                self._add_folders(drive_id, site_id, folder_id, path, level + 1)
+
+    def _add_files(self, drive_id: str, site_id: str, parent_id: str, folder: str) -> None:
+        for file_index in range(self.config.files):
+            word = _WORDS[file_index % len(_WORDS)]
+            ext = _FILE_EXTS[file_index % len(_FILE_EXTS)]
+            name = f"{word}-{file_index:04d}{ext}"
+            path = f"{folder}/{name}" if folder else name
+            content_key = f"shared-{file_index}" if file_index < self.config.shared_files else None
+            self._add_item(
+                drive_id, site_id, parent_id, name, path, is_folder=False, content_key=content_key
+            )
+
+    def _add_item(
+        self,
+        drive_id: str,
+        site_id: str,
+        parent_id: str | None,
+        name: str,
+        path: str,
+        *,
+        is_folder: bool,
+        content_key: str | None = None,
+    ) -> str:
+        item_hex = self._id("item", drive_id, path).upper()
+        item_id = f"01{item_hex[:32]}"
+        if content_key:
+            self.content_keys[item_id] = content_key
+        parent_path = path.rpartition("/")[0]
+        item: dict[str, Any] = {
+            "id": item_id,
+            "name": name,
+            "eTag": f'"{{{item_hex[:8]}-{item_hex[8:12]}-{item_hex[12:16]}}},1"',
+            "cTag": f'"c:{{{item_hex[:8]}}},1"',
+            "createdDateTime": CREATED,
+            "lastModifiedDateTime": MODIFIED,
+            "webUrl": f"{self.drives[drive_id]['webUrl']}/{path}".rstrip("/"),
+            "parentReference": {
+                "driveId": drive_id,
+                "driveType": "documentLibrary",
+                "siteId": site_id,
+                "id": parent_id,
+                "path": f"/drives/{drive_id}/root:" + (f"/{parent_path}" if parent_path else ""),
+                "sharepointIds": {
+                    "listId": self._id("list", drive_id),
+                    "listItemId": str(len(self.items) + 1),
+                },
+            },
+        }
+        if is_folder:
+            item["folder"] = {"childCount": 0}
+            item["size"] = 0
+            self.children[item_id] = []
+        else:
+            content = self.file_bytes(item_id)
+            item["size"] = len(content)
+            item["file"] = {
+                "mimeType": "text/plain",
+                "hashes": {"sha1Hash": hashlib.sha1(content).hexdigest().upper()},
+            }
+        if parent_id is None:
+            item["parentReference"] = {"driveId": drive_id, "siteId": site_id}
+        else:
+            self.children[parent_id].append(item)
+            parent = self.items[parent_id]
+            parent["folder"]["childCount"] += 1
+            parent["size"] += item["size"]
+        self.items[item_id] = item
+        self.paths[(drive_id, path)] = item_id
+        self._touch(item_id)
+        return item_id
+
+    def _touch(self, item_id: str) -> None:
+        self.change_seq += 1
+        self.item_seq[item_id] = self.change_seq
+
+    def drive_tree(self, drive_id: str) -> list[dict[str, Any]]:
+        """Live items of a drive, parents before children."""
+        ordered = [self.items[self.root_ids[drive_id]]]
+        for item in ordered:
+            ordered.extend(self.children.get(item["id"], []))
+        return ordered
+
+    def _item_path(self, drive_id: str, item_id: str) -> str:
+        return next(path for (d, path), i in self.paths.items() if d == drive_id and i == item_id)
+
+    def apply_drive_changes(self, drive_id: str, changes: dict[str, Any]) -> dict[str, Any]:
+        """Mutate a drive so delta queries have something to report.
+
+        ``changes`` counts: ``modify`` / ``delete`` / ``add`` files, ``rename``
+        top-level folders; ``expire`` invalidates every earlier delta token.
+        """
+        site_id = next(site for site, drive in self.site_drives.items() if drive == drive_id)
+        files = sorted(
+            (path, item_id)
+            for (d, path), item_id in self.paths.items()
+            if d == drive_id and "file" in self.items[item_id]
+        )
+        applied: dict[str, list[str]] = {"modify": [], "delete": [], "add": [], "rename": []}
+        for path, item_id in files[: changes.get("modify", 0)]:
+            version = self.versions.get(item_id, 1) + 1
+            self.versions[item_id] = version
+            item = self.items[item_id]
+            content = self.file_bytes(item_id)
+            item["eTag"] = item["eTag"].rsplit(",", 1)[0] + f',{version}"'
+            item["cTag"] = item["cTag"].rsplit(",", 1)[0] + f',{version}"'
+            item["size"] = len(content)
+            item["file"]["hashes"] = {"sha1Hash": hashlib.sha1(content).hexdigest().upper()}
+            self._touch(item_id)
+            applied["modify"].append(path)
+        for path, item_id in files[::-1][: changes.get("delete", 0)]:
+            item = self.items.pop(item_id)
+            del self.paths[(drive_id, path)]
+            parent_id = item["parentReference"]["id"]
+            self.children[parent_id].remove(item)
+            self.items[parent_id]["folder"]["childCount"] -= 1
+            self.tombstones[item_id] = {
+                "id": item_id,
+                "name": item["name"],
+                "deleted": {"state": "deleted"},
+                "parentReference": {"driveId": drive_id, "id": parent_id},
+            }
+            self._touch(item_id)
+            applied["delete"].append(path)
+        for _ in range(changes.get("add", 0)):
+            name = f"added-{self.change_seq:06d}.txt"
+            self._add_item(
+                drive_id, site_id, self.root_ids[drive_id], name, name, is_folder=False
+            )
+            applied["add"].append(name)
+        folders = [
+            child for child in self.children[self.root_ids[drive_id]] if "folder" in child
+        ]
+        for folder in folders[: changes.get("rename", 0)]:
+            old_path = self._item_path(drive_id, folder["id"])
+            new_path = f"{old_path}-renamed"
+            folder["name"] = f"{folder['name']}-renamed"
+            folder["webUrl"] = f"{self.drives[drive_id]['webUrl']}/{new_path}"
+            for (d, path), item_id in list(self.paths.items()):
+                if d == drive_id and (path == old_path or path.startswith(f"{old_path}/")):
+                    del self.paths[(d, path)]
+                    self.paths[(d, new_path + path[len(old_path):])] = item_id
+            # Like Graph, only the folder itself shows up in the next delta.
+            self._touch(folder["id"])
+            applied["rename"].append(f"{old_path} -> {new_path}")
+        if changes.get("expire"):
+            self.delta_floor = self.change_seq
+        return applied
+
+    def file_bytes(self, item_id: str) -> bytes:
+        version = self.versions.get(item_id, 1)
+        key = self.content_keys.get(item_id, item_id)
+        label = key if version == 1 else f"{item_id} v{version}"
+        line = f"{label} {' '.join(_WORDS)}\n".encode("utf-8")
+        size = self.config.file_kb * 1024
+        return (line * (size // len(line) + 1))[:size]
+
+    def resource_bytes(self, resource_id: str) -> bytes:
+        line = f"resource {self.resources[resource_id]}\n".encode("utf-8")
+        size = self.config.resource_kb * 1024
+        return (line * (size // len(line) + 1))[:size]
+
+    def page_html(self, page: dict[str, Any]) -> bytes:
+        title = page["title"]
+        base = page["self"].rsplit("/pages/", 1)[0]
+        blocks = [
+            f'<html lang="en-US"><head><title>{title}</title>'
+            f'<meta name="created" content="{CREATED}" /></head>'
+            '<body data-absolute-enabled="true" style="font-family:Calibri;font-size:11pt">'
+            '<div id="div:{mock}" data-id="_default" style="position:absolute;left:48px;top:115px;width:624px">'
+        ]
+        size = 0
+        index = 0
+        while size < self.config.page_kb * 1024:
+            words = " ".join(_WORDS[(index + offset) % len(_WORDS)] for offset in range(12))
+            block = (
+                f'<h2 style="margin:0">Topic {index}</h2>'
+                f'<p style="margin-top:0pt;margin-bottom:0pt">{words} <b>{title}</b> '
+                f'<a href="https://{MOCK_HOST}/doc/{index}">link {index}</a></p>'
+                f"<ul><li>{words}</li><li>item {index}</li></ul>"
+                f'<table border="1" style="border-collapse:collapse"><tr><td>key {index}</td>'
+                f"<td>{words}</td></tr></table>"
+            )
+            blocks.append(block)
+            size += len(block)
+            index += 1
+        for resource_id, kind in self.page_resources.get(page["id"], []):
+            url = f"{base}/resources/{resource_id}/$value"
+            if kind == "image":
+                blocks.append(
+                    f'<img alt="figure" width="320" height="240" src="{url}" '
+                    f'data-src-type="image/png" data-fullres-src="{url}" '
+                    'data-fullres-src-type="image/png" />'
+                )
+            else:
+                blocks.append(
+                    f'<object data-attachment="{title}.pdf" type="application/pdf" '
+                    f'data="{url}" />'
+                )
+        blocks.append("</div></body></html>")
+        return "".join(blocks).encode("utf-8")
+
+    def site(self, site_id: str) -> dict[str, Any]:
+        for site in self.sites:
+            if site["id"] == site_id:
+                return site
+        raise MockGraphError(404, "itemNotFound", f"Site {site_id} not found")
+
+    def drive_item(self, drive_id: str, item_id: str) -> dict[str, Any]:
+        item = self.items.get(item_id)
+        if drive_id not in self.drives or item is None:
+            raise MockGraphError(404, "itemNotFound", f"Item {item_id} not found")
+        return item
+
+    def drive_item_by_path(self, drive_id: str, path: str) -> dict[str, Any]:
+        item_id = self.paths.get((drive_id, path.strip("/")))
+        if item_id is None:
+            raise MockGraphError(404, "itemNotFound", f"Path {path} not found")
+        return self.items[item_id]
+
+
+def _project(item: dict[str, Any], select: str | None) -> dict[str, Any]:
+    if not select:
+        return item
+    fields = select.split(",")
+    return {key: item[key] for key in fields if key in item}
+
+
+def _split_top_level(expr: str, separator: str) -> list[str]:
+    parts: list[str] = []
+    depth = 0
+    current: list[str] = []
+    for char in expr:
+        depth += char == "("
+        depth -= char == ")"
+        if char == separator and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _parse_expand(expr: str) -> dict[str, dict[str, str]]:
+    """``a($select=x;$expand=b),c`` -> ``{"a": {"$select": "x", "$expand": "b"}, "c": {}}``."""
+    expansions: dict[str, dict[str, str]] = {}
+    for part in _split_top_level(expr, ","):
+        name, _, rest = part.partition("(")
+        options: dict[str, str] = {}
+        for option in _split_top_level(rest[:-1], ";") if rest else []:
+            key, _, value = option.partition("=")
+            options[key.strip()] = value.strip()
+        expansions[name.strip()] = options
+    return expansions
+
+
+class MockGraph:
+    """Routes Graph-style requests against a ``MockCorpus``; transport-agnostic."""
+
+    def __init__(self, config: MockConfig, base_url: str):
+        self.config = config
+        self.base_url = base_url
+        self.corpus = MockCorpus(config)
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+
+    def _roll_throttle(self) -> bool:
+        if self.config.throttle_rate <= 0:
+            return False
+        with self._lock:
+            throttled = self._rng.random() < self.config.throttle_rate
+            if throttled:
+                self.throttled += 1
+        return throttled
+
+    def _throttled_response(self) -> MockResponse:
+        response = _error_response(
+            429, "TooManyRequests", "Too many requests (injected by msgraph_mock)"
+        )
+        response.headers["Retry-After"] = f"{self.config.retry_after:g}"
+        return response
+
+    def _listing(
+        self, path: str, query: dict[str, str], items: list[dict[str, Any]]
+    ) -> MockResponse:
+        size = self.config.page_size
+        if "$top" in query:
+            size = max(1, min(size, int(query["$top"])))
+        skip = int(query.get("$skiptoken", "0"))
+        window = items[skip : skip + size]
+        payload: dict[str, Any] = {
+            "@odata.context": f"{self.base_url}/$metadata",
+            "value": [
+                self._shape(item, query.get("$select"), query.get("$expand"))
+                for item in window
+            ],
+        }
+        if skip + size < len(items):
+            next_query = {**query, "$skiptoken": str(skip + size)}
+            payload["@odata.nextLink"] = (
+                f"{self.base_url}{quote(path, safe='/:,!()=$')}?{urlencode(next_query)}"
+            )
+        return _json_response(payload)
+
+    def _entity(self, query: dict[str, str], item: dict[str, Any]) -> MockResponse:
+        return _json_response(self._shape(item, query.get("$select"), query.get("$expand")))
+
+    def _shape(
+        self, item: dict[str, Any], select: str | None, expand: str | None
+    ) -> dict[str, Any]:
+        """Apply ``$select`` and the OneNote ``sections`` / ``sectionGroups`` expansions."""
+        shaped = _project(item, select)
+        if not expand:
+            return shaped
+        shaped = dict(shaped)
+        corpus = self.corpus
+        for name, options in _parse_expand(expand).items():
+            if name == "sections":
+                children = corpus.sections.get(item["id"])
+            elif name == "sectionGroups":
+                children = corpus.section_groups.get(item["id"])
+            else:
+                continue
+            if children is None:
+                continue
+            nested = options.get("$expand")
+            if name == "sectionGroups" and options.get("$levels") == "max":
+                repeat = ";".join(f"{key}={value}" for key, value in options.items())
+                nested = ",".join(filter(None, (nested, f"sectionGroups({repeat})")))
+            shaped[name] = [
+                self._shape(child, options.get("$select"), nested) for child in children
+            ]
+        return shaped
+
+    def handle(
+        self, method: str, path: str, query: dict[str, str], body: Any, *, batched: bool = False
+    ) -> MockResponse:
+        if self._roll_throttle():
+            return self._throttled_response()
+        try:
+            if method == "POST" and path == "/$batch" and not batched:
+                return self._batch(body)
+            if method == "POST" and path == "/search/query":
+                return self._search(body)
+            if method == "GET":
+                return self._get(path, query)
+        except MockGraphError as exc:
+            return _error_response(exc.status, exc.code, str(exc))
+        except (KeyError, TypeError, ValueError) as exc:
+            return _error_response(400, "invalidRequest", f"{type(exc).__name__}: {exc}")
+        return _error_response(400, "invalidRequest", f"Unsupported {method} {path}")
+
+    def _get(self, path: str, query: dict[str, str]) -> MockResponse:
+        corpus = self.corpus
+        if path == "/sites":
+            search = query.get("search", "").strip().lower()
+            sites = [
+                site
+                for site in corpus.sites
+                if search in ("", "*")
+                or search in site["displayName"].lower()
+                or search in site["name"]
+            ]
+            return self._listing(path, query, sites)
+        if path == "/me/drive":
+            drive_id = corpus.site_drives[corpus.sites[0]["id"]]
+            return self._entity(query, corpus.drives[drive_id])
+
+        if match := re.fullmatch(r"/sites/([^/]+)(/.*)?", path):
+            site_id, rest = match.group(1), match.group(2) or ""
+            corpus.site(site_id)
+            return self._get_site(site_id, rest, path, query)
+        if match := re.fullmatch(r"/drives/([^/]+)(/.*)", path):
+            return self._get_drive(match.group(1), match.group(2), path, query)
+        raise MockGraphError(400, "invalidRequest", f"Unsupported GET {path}")
+
+    def _get_site(
+        self, site_id: str, rest: str, path: str, query: dict[str, str]
+    ) -> MockResponse:
+        corpus = self.corpus
+        if rest == "":
+            return self._entity(query, corpus.site(site_id))
+        if rest == "/drive":
+            return self._entity(query, corpus.drives[corpus.site_drives[site_id]])
+        if rest == "/drives":
+            return self._listing(path, query, [corpus.drives[corpus.site_drives[site_id]]])
+        if rest == "/onenote/notebooks":
+            return self._listing(path, query, corpus.notebooks[site_id])
+        if match := re.fullmatch(
+            r"/onenote/(notebooks|sectionGroups)/([^/]+)(/sections|/sectionGroups)?", rest
+        ):
+            kind, container_id, children = match.groups()
+            if kind == "notebooks":
+                containers = {nb["id"]: nb for nb in corpus.notebooks[site_id]}
+            else:
+                containers = {
+                    group["id"]: group
+                    for groups in corpus.section_groups.values()
+                    for group in groups
+                }
+            if container_id not in containers:
+                raise MockGraphError(404, "20102", f"{kind} {container_id} not found")
+            if children == "/sections":
+                return self._listing(path, query, corpus.sections[container_id])
+            if children == "/sectionGroups":
+                return self._listing(path, query, corpus.section_groups[container_id])
+            return self._entity(query, containers[container_id])
+        if match := re.fullmatch(r"/onenote/sections/([^/]+)/pages", rest):
+            section_id = match.group(1)
+            if section_id not in corpus.pages:
+                raise MockGraphError(404, "20102", f"Section {section_id} not found")
+            return self._listing(path, query, corpus.pages[section_id])
+        if rest == "/onenote/pages":
+            pages = [
+                page
+                for section in corpus.site_sections.get(site_id, [])
+                for page in corpus.pages[section["id"]]
+            ]
+            return self._listing(path, query, pages)
+        if match := re.fullmatch(r"/onenote/resources/([^/]+)/\$value", rest):
+            if match.group(1) not in corpus.resources:
+                raise MockGraphError(404, "20102", f"Resource {match.group(1)} not found")
+            return MockResponse(
+                200, corpus.resource_bytes(match.group(1)), "application/octet-stream"
+            )
+        if match := re.fullmatch(r"/onenote/pages/([^/]+)(/content)?", rest):
+            page = corpus.page_index.get(match.group(1))
+            if page is None:
+                raise MockGraphError(404, "20102", f"Page {match.group(1)} not found")
+            if match.group(2):
+                return MockResponse(200, corpus.page_html(page), "text/html")
+            return self._entity(query, page)
+        raise MockGraphError(400, "invalidRequest", f"Unsupported GET {path}")
+
+    def _get_drive(
+        self, drive_id: str, rest: str, path: str, query: dict[str, str]
+    ) -> MockResponse:
+        corpus = self.corpus
+        if drive_id not in corpus.drives:
+            raise MockGraphError(404, "itemNotFound", f"Drive {drive_id} not found")
+        if rest == "/root/delta":
+            return self._delta(drive_id, path, query)
+        if rest in ("/root", "/root/children"):
+            item = corpus.items[corpus.root_ids[drive_id]]
+        elif match := re.fullmatch(r"/root:(/[^:]*):?(/children)?", rest):
+            item = corpus.drive_item_by_path(drive_id, match.group(1))
+            rest = match.group(2) or ""
+        elif match := re.fullmatch(r"/items/([^/]+)(/children|/content)?", rest):
+            item = corpus.drive_item(drive_id, match.group(1))
+            rest = match.group(2) or ""
+        else:
+            raise MockGraphError(400, "invalidRequest", f"Unsupported GET {path}")
+
+        if rest.endswith("/children"):
+            if "folder" not in item:
+                raise MockGraphError(400, "invalidRequest", f"{item['name']} is not a folder")
+            return self._listing(path, query, corpus.children[item["id"]])
+        if rest == "/content":
+            if "file" not in item:
+                raise MockGraphError(400, "invalidRequest", f"{item['name']} is not a file")
+            # Graph answers /content with a redirect to a pre-authenticated URL.
+            location = f"{self.base_url}/_download/{drive_id}/{item['id']}"
+            return MockResponse(302, headers={"Location": location})
+        return self._entity(query, item)
+
+    def _delta(self, drive_id: str, path: str, query: dict[str, str]) -> MockResponse:
+        """``/root/delta``: everything without a token, else changes since it."""
+        corpus = self.corpus
+        token = query.get("token")
+        snapshot = int(query.get("snapshot", corpus.change_seq))
+        if token == "latest":
+            changed: list[dict[str, Any]] = []
+        elif token is None:
+            changed = corpus.drive_tree(drive_id)
+        else:
+            since = int(token)
+            if since < corpus.delta_floor:
+                raise MockGraphError(410, "resyncRequired", "Delta token expired; resync")
+            candidates = [
+                corpus.items.get(item_id) or corpus.tombstones[item_id]
+                for item_id, seq in corpus.item_seq.items()
+                if since < seq <= snapshot
+            ]
+            changed = sorted(
+                (
+                    item
+                    for item in candidates
+                    if item.get("parentReference", {}).get("driveId", drive_id) == drive_id
+                ),
+                key=lambda item: corpus.item_seq[item["id"]],
+            )
+        size = self.config.page_size
+        skip = int(query.get("$skiptoken", "0"))
+        window = []
+        for item in changed[skip : skip + size]:
+            shaped = dict(_project(item, query.get("$select")))
+            if "parentReference" in shaped:
+                # Graph omits parentReference.path in delta responses.
+                shaped["parentReference"] = {
+                    key: value for key, value in shaped["parentReference"].items() if key != "path"
+                }
+            window.append(shaped)
+        payload: dict[str, Any] = {"@odata.context": f"{self.base_url}/$metadata", "value": window}
+        base = f"{self.base_url}{quote(path, safe='/:,!()=$')}"
+        carried = {key: value for key, value in query.items() if key == "$select"}
+        if skip + size < len(changed):
+            next_query = {**query, "$skiptoken": str(skip + size), "snapshot": str(snapshot)}
+            payload["@odata.nextLink"] = f"{base}?{urlencode(next_query)}"
+        else:
+            payload["@odata.deltaLink"] = f"{base}?{urlencode({**carried, 'token': snapshot})}"
+        return _json_response(payload)
+
+    def _search(self, body: dict[str, Any]) -> MockResponse:
+        search_request = body["requests"][0]
+        query_string = search_request["query"]["queryString"]
+        terms = [
+            term.lower()
+            for term in re.sub(r'\w+:"[^"]*"|\w+:\S+', " ", query_string).split()
+        ]
+        offset = int(search_request.get("from", 0))
+        size = int(search_request.get("size", 25))
+        matches = [
+            item
+            for item in self.corpus.items.values()
+            if "file" in item
+            and (terms == ["*"] or any(term in item["name"].lower() for term in terms))
+        ]
+        window = matches[offset : offset + size]
+        hits = []
+        for rank, item in enumerate(window, start=offset + 1):
+            term = next((t for t in terms if t in item["name"].lower()), "")
+            hits.append(
+                {
+                    "hitId": item["id"],
+                    "rank": rank,
+                    "summary": f"… <c0>{term}</c0> synthetic content …<ddd/>",
+                    "resource": {"@odata.type": "#microsoft.graph.driveItem", **item},
+                }
+            )
+        container = {
+            "hits": hits,
+            "total": len(matches),
+            "moreResultsAvailable": offset + size < len(matches),
+        }
+        return _json_response(
+            {"value": [{"searchTerms": terms, "hitsContainers": [container]}]}
+        )
+
+    def _batch(self, body: dict[str, Any]) -> MockResponse:
+        requests = body["requests"]
+        if len(requests) > 20:
+            raise MockGraphError(400, "invalidRequest", "At most 20 requests per batch")
+        responses = []
+        for request in requests:
+            url = urlsplit(request["url"])
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            result = self.handle(
+                request.get("method", "GET"),
+                unquote(url.path),
+                query,
+                request.get("body"),
+                batched=True,
+            )
+            payload: Any = None
+            if result.body:
+                if result.content_type == "application/json":
+                    payload = json.loads(result.body)
+                else:
+                    payload = base64.b64encode(result.body).decode("ascii")
+            responses.append(
+                {
+                    "id": request["id"],
+                    "status": result.status,
+                    "headers": {"Content-Type": result.content_type, **result.headers},
+                    "body": payload,
+                }
+            )
+        return _json_response({"responses": responses})
+
+    def download(self, drive_id: str, item_id: str) -> MockResponse:
+        try:
+            item = self.corpus.drive_item(drive_id, item_id)
+        except MockGraphError as exc:
+            return _error_response(exc.status, exc.code, str(exc))
+        return MockResponse(200, self.corpus.file_bytes(item["id"]), "application/octet-stream")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle + delayed-ACK stalls.
+    disable_nagle_algorithm = True
+    server: _MockServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _dispatch(self, method: str) -> None:
+        graph = self.server.graph
+        config = graph.config
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        delay = config.latency_ms + random.uniform(0, config.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        if path.startswith(f"{API_PREFIX}/_download/"):
+            drive_id, _, item_id = path[len(f"{API_PREFIX}/_download/"):].partition("/")
+            response = graph.download(drive_id, item_id)
+        elif method == "POST" and path == "/_mock/drive-changes":
+            # Test hook: {"drive_id": optional, "modify": n, "delete": n, "add": n, "rename": n}
+            body = json.loads(raw_body) if raw_body else {}
+            with graph._lock:
+                corpus = graph.corpus
+                drive_id = body.get("drive_id") or next(iter(corpus.drives))
+                response = _json_response(corpus.apply_drive_changes(drive_id, body))
+        elif not path.startswith(API_PREFIX):
+            response = _error_response(404, "notFound", f"Unknown path {path}")
+        elif not self.headers.get("Authorization", "").startswith("Bearer "):
+            response = _error_response(
+                401, "InvalidAuthenticationToken", "Access token is empty."
+            )
+        else:
+            body = json.loads(raw_body) if raw_body else None
+            response = graph.handle(method, path[len(API_PREFIX):], query, body)
+
+        etag = None
+        if response.status == 200 and response.content_type == "application/json":
+            digest = hashlib.md5(response.body, usedforsecurity=False).hexdigest()[:16]
+            etag = f'W/"{digest}"'
+            if method == "GET" and self.headers.get("If-None-Match") == etag:
+                response = MockResponse(304, content_type="")
+
+        with graph._lock:
+            graph.requests += 1
+            graph.bytes_sent += len(response.body)
+        self.send_response(response.status)
+        if response.content_type:
+            self.send_header("Content-Type", response.content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if method != "HEAD":
+            self.wfile.write(response.body)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+
+class _MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], graph_config: MockConfig, *, verbose: bool):
+        super().__init__(address, _Handler)
+        host, port = self.server_address[:2]
+        self.graph = MockGraph(graph_config, f"http://{host}:{port}{API_PREFIX}")
+        self.verbose = verbose
+
+
+def serve(
+    config: MockConfig,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    *,
+    verbose: bool = False,
+) -> _MockServer:
+    """Create a bound mock server; call ``serve_forever()`` (e.g. in a thread)."""
+    return _MockServer((host, port), config, verbose=verbose)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Serve a synthetic Microsoft Graph tenant for offline load testing"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0 picks a free port")
+    parser.add_argument("--sites", type=int, default=MockConfig.sites)
+    parser.add_argument("--notebooks", type=int, default=MockConfig.notebooks, help="Notebooks per site")
+    parser.add_argument("--sections", type=int, default=MockConfig.sections, help="Sections per notebook")
+    parser.add_argument(
+        "--section-groups",
+        type=int,
+        default=MockConfig.section_groups,
+        help="Section groups per notebook, each with --sections sections and one nested group",
+    )
+    parser.add_argument("--pages", type=int, default=MockConfig.pages, help="Pages per section")
+    parser.add_argument("--folders", type=int, default=MockConfig.folders, help="Folders under each drive root")
+    parser.add_argument("--depth", type=int, default=MockConfig.depth, help="Folder nesting levels (--folders per level)")
+    parser.add_argument(
+        "--shared-files",
+        type=int,
+        default=MockConfig.shared_files,
+        help="First N files of every folder have the same bytes everywhere (copied decks)",
+    )
+    parser.add_argument("--files", type=int, default=MockConfig.files, help="Files per folder (and in the root)")
+    parser.add_argument("--page-kb", type=int, default=MockConfig.page_kb, help="Approximate OneNote page HTML size")
+    parser.add_argument("--file-kb", type=int, default=MockConfig.file_kb, help="Drive file size")
+    parser.add_argument("--images", type=int, default=MockConfig.images, help="Images per OneNote page (the first is a shared section logo)")
+    parser.add_argument("--resource-kb", type=int, default=MockConfig.resource_kb, help="OneNote image/attachment size")
+    parser.add_argument("--page-size", type=int, default=MockConfig.page_size, help="Max items per listing page")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed delay added to every request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random delay")
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="Probability (0-1) of answering a request or $batch sub-request with 429",
+    )
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on injected 429s")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    return parser
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    config = MockConfig(
+        sites=args.sites,
+        notebooks=args.notebooks,
+        sections=args.sections,
+        section_groups=args.section_groups,
+        pages=args.pages,
+        folders=args.folders,
+        depth=args.depth,
+        shared_files=args.shared_files,
+        files=args.files,
+        page_kb=args.page_kb,
+        file_kb=args.file_kb,
+        images=args.images,
+        resource_kb=args.resource_kb,
+        page_size=args.page_size,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = serve(config, args.host, args.port, verbose=args.verbose)
+    graph = server.graph
+    corpus = graph.corpus
+    print(
+        f"{len(corpus.sites)} site(s), {len(corpus.page_index)} page(s), "
+        f"{sum('file' in item for item in corpus.items.values())} file(s)",
+        file=sys.stderr,
+    )
+    print(f"export MICROSOFT_GRAPH_BASE={graph.base_url}", file=sys.stderr)
+    print("export MICROSOFT_ACCESS_TOKEN=mock", file=sys.stderr)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(
+            f"\n{graph.requests} request(s), {graph.throttled} throttled, "
+            f"{graph.bytes_sent / 1_000_000:.1f} MB sent",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
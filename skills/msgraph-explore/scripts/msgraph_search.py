@@ -22,10 +22,12 @@ from typing import Any
 from msgraph_auth import (
     CACHE_ROOT,
     DEFAULT_ENV_PATH,
+    GRAPH_RATE_LIMITER,
     SEARCH_SCOPES,
     AuthError,
     GraphApiError,
     GraphClient,
+    request_tracing,
 )
 
 
@@ -158,6 +160,25 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Path to .env file (default: skill dir .env)",
     )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        metavar="FILE",
+        help="Append one JSON line per Graph request to FILE",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print Graph latency, throughput and cache-hit stats to stderr at exit",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        metavar="RPS",
+        help="Graph requests per second for this process "
+        "(default: $MICROSOFT_GRAPH_RATE_LIMIT or 10; 0 disables pacing)",
+    )
     parser.add_argument(
         "query",
         help="Search query string (supports KQL syntax)",
@@ -213,23 +234,26 @@ def main() -> int:
     parser = _build_parser()
     args = parser.parse_args()
 
-    try:
-        client = SearchClient(env_path=args.env)
-        entity_types = [t.strip() for t in args.entity_types.split(",")]
-        hits = client.search(
-            args.query,
-            entity_types=entity_types,
-            site_path=args.site_path,
-            max_results=args.max_results,
-        )
-        if args.json_output:
-            _print_json(hits)
-        else:
-            _print_human(hits)
-        return 0
-    except (AuthError, GraphApiError) as exc:
-        print(str(exc), file=sys.stderr)
-        return 1
+    if args.rate_limit is not None:
+        GRAPH_RATE_LIMITER.configure(args.rate_limit)
+    with request_tracing(args.trace, print_stats=args.stats):
+        try:
+            client = SearchClient(env_path=args.env)
+            entity_types = [t.strip() for t in args.entity_types.split(",")]
+            hits = client.search(
+                args.query,
+                entity_types=entity_types,
+                site_path=args.site_path,
+                max_results=args.max_results,
+            )
+            if args.json_output:
+                _print_json(hits)
+            else:
+                _print_human(hits)
+            return 0
+        except (AuthError, GraphApiError) as exc:
+            print(str(exc), file=sys.stderr)
+            return 1
 
 
 if __name__ == "__main__":